@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Docker Compose Helpers
+
+Shared helpers for Docker Compose-based domains, used by both the
+DockerComposeDeployer and the DockerComposeVisualizer.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+import selectors
+import subprocess
+import threading
+import json
+import time
+import re
+import os
+
+# orjson is optional: it decodes docker's per-container JSON lines faster
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Characters not allowed in project name components
+_SANITIZE = re.compile(r'[^\w-]')
+
+# Fields of `docker ps --format "{{json .}}"` output
+_SERVICE_LABEL = re.compile(r'(?:^|,)com\.docker\.compose\.service=([^,]*)')
+_HEALTH_STATUS = re.compile(r'\((healthy|unhealthy|health: starting)\)')
+_PORT_MAPPING = re.compile(r':(\d+)->(\d+)/')
+
+# Shared Docker Engine API client, created on first use
+_client = None
+_client_checked = False
+_client_lock = threading.Lock()
+
+
+@lru_cache(maxsize=256)
+def get_project_name(project_prefix: str, level_path: Path) -> str:
+    """
+    Generate Docker Compose project name from level path.
+
+    Args:
+        project_prefix: Domain prefix (e.g., "arena_web")
+        level_path: Path to the level directory
+
+    Returns:
+        Project name string (e.g., "arena_web_world-1-injection_level-01-reflected-xss")
+    """
+    parts = level_path.parts
+    world = parts[-2] if len(parts) >= 2 else "unknown"
+    level = parts[-1] if len(parts) >= 1 else "unknown"
+
+    # Clean up names (remove non-alphanumeric except dash/underscore)
+    world = _SANITIZE.sub('_', world)
+    level = _SANITIZE.sub('_', level)
+
+    return f"{project_prefix}_{world}_{level}".lower()
+
+
+def get_docker_client():
+    """
+    Get the shared Docker Engine API client if the Docker SDK is available.
+
+    The client keeps its connection to the daemon open for the life of the
+    process and is shared by every deployer and visualizer. Returns None
+    when the SDK is not installed or the daemon does not answer a ping
+    (e.g. a docker context or rootless socket the SDK doesn't honour), in
+    which case callers use the docker CLI.
+
+    The SDK is optional and heavy to import, so it is only imported here,
+    the first time a daemon query is made.
+    """
+    global _client, _client_checked
+    if not _client_checked:
+        with _client_lock:
+            if not _client_checked:
+                try:
+                    import docker
+                    _client = docker.from_env()
+                    # from_env() doesn't connect, so check the daemon answers
+                    _client.ping()
+                except Exception:
+                    _client = None
+                _client_checked = True
+    return _client
+
+
+def list_project_containers(client, project_name: str, include_stopped: bool = False) -> list:
+    """
+    List a compose project's containers through the Engine API.
+
+    Args:
+        client: Docker SDK client
+        project_name: Docker Compose project name
+        include_stopped: Include stopped containers
+
+    Returns:
+        List of docker SDK Container objects
+    """
+    return client.containers.list(
+        all=include_stopped,
+        filters={"label": f"com.docker.compose.project={project_name}"}
+    )
+
+
+def container_ps_info(container) -> Dict[str, Any]:
+    """
+    Convert an SDK Container into the dict shape `docker compose ps` prints.
+
+    Args:
+        container: docker SDK Container object
+
+    Returns:
+        Dict with Name, Service, State, Health and Publishers keys
+    """
+    attrs = container.attrs
+    state = attrs.get('State', {})
+    health = state.get('Health', {}).get('Status', '') if isinstance(state, dict) else ''
+
+    publishers = []
+    seen = set()
+    for port, bindings in (container.ports or {}).items():
+        target_port = int(port.split('/', 1)[0])
+        for binding in bindings or []:
+            published_port = int(binding.get('HostPort') or 0)
+            # The daemon lists IPv4 and IPv6 bindings separately
+            if published_port and (published_port, target_port) not in seen:
+                seen.add((published_port, target_port))
+                publishers.append({'TargetPort': target_port, 'PublishedPort': published_port})
+
+    return {
+        'Name': container.name,
+        'Service': container.labels.get('com.docker.compose.service', 'unknown'),
+        'State': container.status,
+        'Health': health,
+        'Publishers': publishers,
+    }
+
+
+def query_project_containers(project_name: str, timeout: float = 10) -> Optional[List[Dict[str, Any]]]:
+    """
+    List a compose project's running containers with a single `docker ps`.
+
+    Filtering on the compose project label asks the daemon directly, so
+    compose never has to start up and parse the project's YAML. Results are
+    converted to the dict shape `docker compose ps --format json` prints.
+
+    Args:
+        project_name: Docker Compose project name
+        timeout: Seconds to wait before the process is killed
+
+    Returns:
+        List of container dicts, or None if the command failed
+
+    Raises:
+        subprocess.TimeoutExpired: If docker does not finish within timeout
+    """
+    cmd = ["docker", "ps", "--filter", f"label=com.docker.compose.project={project_name}",
+           "--format", "{{json .}}"]
+    infos = _read_json_lines(cmd, timeout)
+    if infos is None:
+        return None
+    return [_docker_ps_info(info) for info in infos]
+
+
+def _docker_ps_info(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert one `docker ps` JSON line into the `docker compose ps` shape."""
+    service = _SERVICE_LABEL.search(info.get('Labels', ''))
+    health = _HEALTH_STATUS.search(info.get('Status', ''))
+
+    publishers = []
+    seen = set()
+    # e.g. "0.0.0.0:8081->5000/tcp, :::8081->5000/tcp"
+    for published, target in _PORT_MAPPING.findall(info.get('Ports', '')):
+        if (published, target) not in seen:
+            seen.add((published, target))
+            publishers.append({'TargetPort': int(target), 'PublishedPort': int(published)})
+
+    return {
+        'Name': info.get('Names', 'unknown').split(',', 1)[0],
+        'Service': service.group(1) if service else 'unknown',
+        'State': info.get('State', 'unknown'),
+        'Health': health.group(1).replace('health: ', '') if health else '',
+        'Publishers': publishers,
+    }
+
+
+def _read_json_lines(cmd: List[str], timeout: float) -> Optional[List[Dict[str, Any]]]:
+    """
+    Run a command that prints one JSON object per line and parse it as it streams.
+
+    Args:
+        cmd: Command to run
+        timeout: Seconds to wait before the process is killed
+
+    Returns:
+        List of decoded objects, or None if the command failed
+
+    Raises:
+        subprocess.TimeoutExpired: If the command does not finish within timeout
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + timeout
+
+    # Wait on the pipe with a selector so the deadline is enforced without
+    # a helper thread, decoding complete lines as each chunk arrives
+    objects = []
+    pending = b''
+    with proc.stdout, selectors.DefaultSelector() as selector:
+        selector.register(proc.stdout, selectors.EVENT_READ)
+        fd = proc.stdout.fileno()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not selector.select(remaining):
+                _kill(proc)
+                raise subprocess.TimeoutExpired(cmd, timeout)
+
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk).split(b'\n')
+            objects.extend(info for info in map(_parse_line, lines) if info is not None)
+
+    info = _parse_line(pending)
+    if info is not None:
+        objects.append(info)
+
+    try:
+        returncode = proc.wait(timeout=max(deadline - time.monotonic(), 0))
+    except subprocess.TimeoutExpired:
+        _kill(proc)
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+    if returncode != 0:
+        return None
+    return objects
+
+
+def _kill(proc: subprocess.Popen):
+    """Kill a timed-out process and reap it."""
+    proc.kill()
+    try:
+        proc.wait(timeout=1)
+    except subprocess.TimeoutExpired:
+        pass
+
+
+def _parse_line(line: bytes) -> Optional[Dict[str, Any]]:
+    """Decode one line of JSON output, or None if it isn't valid."""
+    if not line.strip():
+        return None
+    try:
+        return _json_loads(line)
+    except ValueError:
+        return None
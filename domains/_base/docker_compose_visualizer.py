@@ -9,13 +9,18 @@ Shared across all domains that use Docker Compose (Web Security, API Security, e
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 import subprocess
-import json
-import sys
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from .visualizer import DomainVisualizer
+from .docker_compose import (
+    container_ps_info,
+    get_docker_client,
+    get_project_name,
+    list_project_containers,
+    query_project_containers,
+)
 
-from domains._base.visualizer import DomainVisualizer
+# Container ports that get a browser URL (TargetPort may be an int or str)
+_WEB_PORTS = frozenset({80, 3000, 5000, 8000, 8080, '80', '3000', '5000', '8000', '8080'})
 
 
 class DockerComposeVisualizer(DomainVisualizer):
@@ -72,48 +77,49 @@ class DockerComposeVisualizer(DomainVisualizer):
         try:
             project_name = self._get_project_name(level_path)
 
-            # Get container information
-            result = subprocess.run(
-                ["docker", "compose", "-f", str(compose_file), "-p", project_name, "ps", "--format", "json"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            # Get container information, over the Engine API when available
+            # and through the CLI if the SDK call fails
+            infos = None
+            client = get_docker_client()
+            if client is not None:
+                try:
+                    infos = [container_ps_info(c) for c in list_project_containers(client, project_name)]
+                except Exception:
+                    client = None
+            if client is None:
+                infos = query_project_containers(project_name, timeout=10) or []
 
             containers = []
-            if result.returncode == 0 and result.stdout.strip():
-                for line in result.stdout.strip().split('\n'):
-                    try:
-                        container_info = json.loads(line)
-
-                        # Extract port mappings
-                        ports = []
-                        urls = []
-                        publishers = container_info.get('Publishers', [])
-                        if publishers:
-                            for pub in publishers:
-                                if isinstance(pub, dict):
-                                    target_port = pub.get('TargetPort', '')
-                                    published_port = pub.get('PublishedPort', '')
-                                    if published_port:
-                                        ports.append(f"{published_port}:{target_port}")
-                                        # Generate URL for common web ports
-                                        if target_port in [80, 3000, 5000, 8000, 8080]:
-                                            urls.append(f"http://localhost:{published_port}")
-
-                        containers.append({
-                            'name': container_info.get('Name', 'unknown'),
-                            'service': container_info.get('Service', 'unknown'),
-                            'status': container_info.get('State', 'unknown'),
-                            'health': container_info.get('Health', 'none'),
-                            'ports': ports,
-                            'urls': urls
-                        })
-                    except json.JSONDecodeError:
-                        continue
+            states = []
+            for container_info in infos:
+                # Extract port mappings
+                ports = []
+                urls = []
+                publishers = container_info.get('Publishers', [])
+                if publishers:
+                    for pub in publishers:
+                        if isinstance(pub, dict):
+                            target_port = pub.get('TargetPort', '')
+                            published_port = pub.get('PublishedPort', '')
+                            if published_port:
+                                ports.append(f"{published_port}:{target_port}")
+                                # Generate URL for common web ports
+                                if target_port in _WEB_PORTS:
+                                    urls.append(f"http://localhost:{published_port}")
+
+                state = container_info.get('State', 'unknown')
+                states.append(state)
+                containers.append({
+                    'name': container_info.get('Name', 'unknown'),
+                    'service': container_info.get('Service', 'unknown'),
+                    'status': state,
+                    'health': container_info.get('Health', 'none'),
+                    'ports': ports,
+                    'urls': urls
+                })
 
             # Determine overall status
-            all_running = all(c['status'] == 'running' for c in containers) if containers else False
+            all_running = bool(states) and set(states) == {'running'}
 
             return {
                 'domain': self.domain_id,
@@ -287,7 +293,7 @@ class DockerComposeVisualizer(DomainVisualizer):
             return "No containers running"
 
         containers = data['containers']
-        running_count = sum(1 for c in containers if c['status'] == 'running')
+        running_count = [c['status'] for c in containers].count('running')
 
         lines = [f"Running {running_count}/{len(containers)} containers"]
 
@@ -309,15 +315,7 @@ class DockerComposeVisualizer(DomainVisualizer):
         Returns:
             Project name string
         """
-        parts = level_path.parts
-        world = parts[-2] if len(parts) >= 2 else "unknown"
-        level = parts[-1] if len(parts) >= 1 else "unknown"
-
-        # Clean up names
-        world = ''.join(c if c.isalnum() or c in '-_' else '_' for c in world)
-        level = ''.join(c if c.isalnum() or c in '-_' else '_' for c in level)
-
-        return f"{self.project_prefix}_{world}_{level}".lower()
+        return get_project_name(self.project_prefix, level_path)
 
 
 class NoOpVisualizer(DomainVisualizer):
@@ -12,6 +12,12 @@ from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field
 import yaml
 
+# libyaml's C loader is much faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass
 class DomainConfig:
@@ -36,7 +42,7 @@ class DomainConfig:
     def from_yaml(cls, yaml_path: Path) -> 'DomainConfig':
         """Load configuration from YAML file"""
         with open(yaml_path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
 
         metadata = data.get('metadata', {})
         capabilities = data.get('capabilities', {})
@@ -92,7 +98,7 @@ class Challenge:
             raise FileNotFoundError(f"mission.yaml not found in {level_path}")
 
         with open(mission_file, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
 
         return cls(
             id=f"{world}-{level_path.name}",
@@ -6,6 +6,7 @@ A domain focused on API security vulnerabilities and exploitation.
 This domain teaches OWASP API Security Top 10:2023 through hands-on challenges.
 """
 
+from collections import ChainMap
 from pathlib import Path
 import sys
 
@@ -81,10 +82,9 @@ class APISecurityDomain(Domain):
         Returns:
             DockerComposeVisualizer instance (shared across Docker Compose domains)
         """
-        # Include domain path in config for correct path inference
-        config_dict = self.config.__dict__.copy()
-        config_dict['domain_path'] = self.path
-        return DockerComposeVisualizer(config_dict)
+        # Layer the domain path over the config for correct path inference,
+        # without copying the config dict
+        return DockerComposeVisualizer(ChainMap({'domain_path': self.path}, self.config.__dict__))
 
 
 def load_domain(domain_path: Path) -> APISecurityDomain:
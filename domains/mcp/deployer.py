@@ -116,7 +116,7 @@ class MCPDeployer(ChallengeDeployer):
             if not gateway_success:
                 return False, f"Failed to start gateway: {gateway_msg}"
 
-            logger.info(f"Gateway status: {gateway_msg}")
+            logger.info("Gateway status: %s", gateway_msg)
 
             # Step 2: Load server configuration
             server_config_file = level_path / "server_config.yaml"
@@ -153,7 +153,7 @@ class MCPDeployer(ChallengeDeployer):
             # Step 5: Update gateway routing (via HTTP API)
             routing_success, routing_msg = self._update_gateway_routing(challenge_id, backend_url)
             if not routing_success:
-                logger.warning(f"Gateway routing update failed: {routing_msg}")
+                logger.warning("Gateway routing update failed: %s", routing_msg)
 
             # Step 6: Save state
             self._save_state()
@@ -163,7 +163,7 @@ class MCPDeployer(ChallengeDeployer):
             return True, f"MCP challenge deployed successfully!\n\n{setup_msg}"
 
         except Exception as e:
-            logger.error(f"Error deploying challenge: {e}", exc_info=True)
+            logger.error("Error deploying challenge: %s", e, exc_info=True)
             return False, f"Deployment error: {str(e)}"
 
     def cleanup_challenge(self, level_path: Path) -> Tuple[bool, str]:
@@ -196,7 +196,7 @@ class MCPDeployer(ChallengeDeployer):
                 return True, f"Challenge {challenge_id} was not running"
 
         except Exception as e:
-            logger.error(f"Error cleaning up challenge: {e}", exc_info=True)
+            logger.error("Error cleaning up challenge: %s", e, exc_info=True)
             return False, f"Cleanup error: {str(e)}"
 
     def get_status(self, level_path: Path) -> Dict[str, Any]:
@@ -496,9 +496,9 @@ if __name__ == "__main__":
                         except Exception:
                             os.kill(pid, 1)  # Fallback
 
-                logger.info(f"Stopped backend server (PID {pid})")
+                logger.info("Stopped backend server (PID %s)", pid)
             except Exception as e:
-                logger.error(f"Error stopping backend: {e}")
+                logger.error("Error stopping backend: %s", e)
 
         # Remove from state
         del state["backends"][challenge_id]
@@ -563,7 +563,7 @@ if __name__ == "__main__":
                 return False, f"Failed to register backend: {error_msg}"
 
         except requests.RequestException as e:
-            logger.warning(f"Could not update gateway routing: {e}")
+            logger.warning("Could not update gateway routing: %s", e)
             return False, f"Gateway routing update failed: {str(e)}"
 
     # State management
@@ -577,7 +577,7 @@ if __name__ == "__main__":
             with open(self.state_file, 'r') as f:
                 return json.load(f)
         except Exception as e:
-            logger.error(f"Error loading state: {e}")
+            logger.error("Error loading state: %s", e)
             return None
 
     def _save_state(self):
@@ -591,7 +591,7 @@ if __name__ == "__main__":
             with open(self.state_file, 'w') as f:
                 json.dump(state, f, indent=2)
         except Exception as e:
-            logger.error(f"Error saving state: {e}")
+            logger.error("Error saving state: %s", e)
 
     # Helper methods
 
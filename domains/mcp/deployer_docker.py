@@ -133,7 +133,7 @@ class MCPDockerDeployer(ChallengeDeployer):
             config = server_info.get("config", {})
 
             # Step 4: Start backend container
-            logger.info(f"Starting backend container for {challenge_id}...")
+            logger.info("Starting backend container for %s...", challenge_id)
             backend_success, backend_msg = self._start_backend_container(
                 challenge_id, level_path, module_name, port, config
             )
@@ -151,14 +151,14 @@ class MCPDockerDeployer(ChallengeDeployer):
             logger.info("Registering backend with gateway...")
             routing_success, routing_msg = self._update_gateway_routing(challenge_id, backend_url_internal)
             if not routing_success:
-                logger.warning(f"Gateway routing update failed: {routing_msg}")
+                logger.warning("Gateway routing update failed: %s", routing_msg)
 
             # Success message
             setup_msg = self._get_setup_message(challenge_id)
             return True, f"MCP challenge deployed successfully!\n\n{setup_msg}"
 
         except Exception as e:
-            logger.error(f"Error deploying challenge: {e}", exc_info=True)
+            logger.error("Error deploying challenge: %s", e, exc_info=True)
             return False, f"Deployment error: {str(e)}"
 
     def cleanup_challenge(self, level_path: Path) -> Tuple[bool, str]:
@@ -175,13 +175,13 @@ class MCPDockerDeployer(ChallengeDeployer):
             challenge_id = level_path.name
 
             # Stop backend container
-            logger.info(f"Stopping backend container...")
+            logger.info("Stopping backend container...")
             self._stop_backend_container()
 
             return True, f"Challenge {challenge_id} cleaned up (gateway still running)"
 
         except Exception as e:
-            logger.error(f"Error cleaning up challenge: {e}", exc_info=True)
+            logger.error("Error cleaning up challenge: %s", e, exc_info=True)
             return False, f"Cleanup error: {str(e)}"
 
     def cleanup_all_containers(self):
@@ -201,9 +201,9 @@ class MCPDockerDeployer(ChallengeDeployer):
                     capture_output=True,
                     timeout=10
                 )
-                logger.info(f"Stopped gateway container: {self.GATEWAY_CONTAINER}")
+                logger.info("Stopped gateway container: %s", self.GATEWAY_CONTAINER)
             except Exception as e:
-                logger.warning(f"Error stopping gateway container: {e}")
+                logger.warning("Error stopping gateway container: %s", e)
 
             # Clean up network if no other containers using it
             try:
@@ -212,13 +212,13 @@ class MCPDockerDeployer(ChallengeDeployer):
                     capture_output=True,
                     timeout=5
                 )
-                logger.info(f"Removed network: {self.MCP_NETWORK}")
+                logger.info("Removed network: %s", self.MCP_NETWORK)
             except Exception:
                 # Network might still be in use or already removed, that's okay
                 pass
 
         except Exception as e:
-            logger.error(f"Error during full cleanup: {e}")
+            logger.error("Error during full cleanup: %s", e)
 
     def get_status(self, level_path: Path) -> Dict[str, Any]:
         """
@@ -265,11 +265,11 @@ class MCPDockerDeployer(ChallengeDeployer):
             )
 
             if result.stdout.strip():
-                logger.info(f"Docker image {self.image_name} already exists")
+                logger.info("Docker image %s already exists", self.image_name)
                 return True, f"Image ready ({self.version})"
 
             # Build image using docker-compose with IMAGE_TAG env var
-            logger.info(f"Building Docker image {self.image_name} (this may take a minute)...")
+            logger.info("Building Docker image %s (this may take a minute)...", self.image_name)
             env = {**subprocess.os.environ, "IMAGE_TAG": self.version}
             result = subprocess.run(
                 ["docker-compose", "-f", str(self.DOCKER_COMPOSE_FILE), "build"],
@@ -353,7 +353,7 @@ class MCPDockerDeployer(ChallengeDeployer):
             )
 
             container_id = result.stdout.strip()
-            logger.info(f"Backend container started: {container_id[:12]}")
+            logger.info("Backend container started: %s", container_id[:12])
             return True, f"Backend started (port {port})"
 
         except subprocess.CalledProcessError as e:
@@ -370,7 +370,7 @@ class MCPDockerDeployer(ChallengeDeployer):
                 timeout=10
             )
         except Exception as e:
-            logger.warning(f"Error stopping backend container: {e}")
+            logger.warning("Error stopping backend container: %s", e)
 
     def _is_container_running(self, container_name: str) -> bool:
         """Check if container is running."""
@@ -67,10 +67,10 @@ class MCPGatewayProxySDK:
                             if port:
                                 self.active_backend_url = f"http://localhost:{port}"
                                 self.active_challenge_id = challenge_id
-                                logger.info(f"Loaded active backend: {challenge_id} -> {self.active_backend_url}")
+                                logger.info("Loaded active backend: %s -> %s", challenge_id, self.active_backend_url)
                                 break
             except Exception as e:
-                logger.warning(f"Could not load state: {e}")
+                logger.warning("Could not load state: %s", e)
 
     def _register_admin_tools(self):
         """Register gateway administration tools."""
@@ -113,7 +113,7 @@ class MCPGatewayProxySDK:
             self.active_challenge_id = challenge_id
             self.active_backend_url = backend_url
             self.backend_tools = []  # Clear cached tools
-            logger.info(f"Backend updated: {challenge_id} -> {backend_url}")
+            logger.info("Backend updated: %s -> %s", challenge_id, backend_url)
             return f"Backend set to: {challenge_id} ({backend_url})"
 
     async def fetch_backend_tools(self) -> List[Dict[str, Any]]:
@@ -163,10 +163,10 @@ class MCPGatewayProxySDK:
             data = tools_response.json()
             if "result" in data and "tools" in data["result"]:
                 self.backend_tools = data["result"]["tools"]
-                logger.info(f"Fetched {len(self.backend_tools)} tools from backend")
+                logger.info("Fetched %s tools from backend", len(self.backend_tools))
 
         except Exception as e:
-            logger.error(f"Error fetching backend tools: {e}")
+            logger.error("Error fetching backend tools: %s", e)
 
         return self.backend_tools
 
@@ -174,8 +174,8 @@ class MCPGatewayProxySDK:
         """Run gateway with streamable-http transport."""
         import uvicorn
 
-        logger.info(f"Starting MCP Gateway on port {self.port}")
-        logger.info(f"Active backend: {self.active_backend_url or 'None'}")
+        logger.info("Starting MCP Gateway on port %s", self.port)
+        logger.info("Active backend: %s", self.active_backend_url or 'None')
 
         # Get FastMCP Starlette app
         app = self.mcp.streamable_http_app()
@@ -153,7 +153,7 @@ class MCPGatewayServer:
             # Register backend with router
             self.router.set_active_challenge(challenge_id, backend_url)
 
-            logger.info(f"Registered backend: {challenge_id} -> {backend_url}")
+            logger.info("Registered backend: %s -> %s", challenge_id, backend_url)
 
             return web.json_response({
                 "success": True,
@@ -168,7 +168,7 @@ class MCPGatewayServer:
                 "error": "Invalid JSON body"
             }, status=400)
         except Exception as e:
-            logger.error(f"Error registering backend: {e}")
+            logger.error("Error registering backend: %s", e)
             return web.json_response({
                 "success": False,
                 "error": str(e)
@@ -204,13 +204,13 @@ class MCPGatewayServer:
 
         if not session_id:
             session_id = self.session_manager.create_session()
-            logger.info(f"Created new session: {session_id}")
+            logger.info("Created new session: %s", session_id)
         else:
             # Validate existing session
             if not self.session_manager.get_session(session_id):
-                logger.warning(f"Invalid session ID provided: {session_id}, creating new session")
+                logger.warning("Invalid session ID provided: %s, creating new session", session_id)
                 session_id = self.session_manager.create_session()
-                logger.info(f"Created new session: {session_id}")
+                logger.info("Created new session: %s", session_id)
 
         # Parse JSON-RPC message
         try:
@@ -225,7 +225,7 @@ class MCPGatewayServer:
                 return web.json_response(error_response, status=400)
 
         except Exception as e:
-            logger.error(f"Error parsing request: {e}")
+            logger.error("Error parsing request: %s", e)
             error_response = self.protocol_handler.create_error_response(
                 -32700,
                 f"Failed to parse request: {e}"
@@ -327,9 +327,9 @@ class MCPGatewayServer:
                 self.session_manager.touch_session(session_id)
 
         except asyncio.CancelledError:
-            logger.info(f"SSE stream cancelled for session {session_id}")
+            logger.info("SSE stream cancelled for session %s", session_id)
         except Exception as e:
-            logger.error(f"Error in SSE stream: {e}")
+            logger.error("Error in SSE stream: %s", e)
         finally:
             await response.write_eof()
 
@@ -344,7 +344,7 @@ class MCPGatewayServer:
         self.site = web.TCPSite(self.runner, '0.0.0.0', self.port)
         await self.site.start()
 
-        logger.info(f"MCP Gateway started on http://localhost:{self.port}/mcp")
+        logger.info("MCP Gateway started on http://localhost:%s/mcp", self.port)
 
     async def stop(self):
         """Stop the gateway server."""
@@ -15,6 +15,15 @@ import json
 import logging
 from typing import Dict, Any, List, Optional
 
+# Prefer orjson for encoding responses when it is installed
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_dumps = json.dumps
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,7 +73,7 @@ class VulnerableMCPServer(ABC):
             "status": "healthy",
             "server": self.get_server_name(),
             "port": self.port
-        })
+        }, dumps=_json_dumps)
 
     async def handle_post_mcp(self, request: web.Request) -> web.Response:
         """
@@ -87,7 +96,7 @@ class VulnerableMCPServer(ABC):
                     "message": f"Parse error: {e}"
                 },
                 "id": None
-            }, status=400)
+            }, status=400, dumps=_json_dumps)
 
         # Extract method
         method = message.get("method")
@@ -118,16 +127,16 @@ class VulnerableMCPServer(ABC):
                         "message": f"Method not found: {method}"
                     },
                     "id": request_id
-                })
+                }, dumps=_json_dumps)
 
             return web.json_response({
                 "jsonrpc": "2.0",
                 "result": result,
                 "id": request_id
-            })
+            }, dumps=_json_dumps)
 
         except Exception as e:
-            logger.error(f"Error handling {method}: {e}")
+            logger.error("Error handling %s: %s", method, e)
             return web.json_response({
                 "jsonrpc": "2.0",
                 "error": {
@@ -135,7 +144,7 @@ class VulnerableMCPServer(ABC):
                     "message": f"Internal error: {str(e)}"
                 },
                 "id": request_id
-            }, status=500)
+            }, status=500, dumps=_json_dumps)
 
     async def handle_get_mcp(self, request: web.Request) -> web.StreamResponse:
         """
@@ -163,7 +172,7 @@ class VulnerableMCPServer(ABC):
         except asyncio.CancelledError:
             logger.info("SSE stream cancelled")
         except Exception as e:
-            logger.error(f"Error in SSE stream: {e}")
+            logger.error("Error in SSE stream: %s", e)
         finally:
             await response.write_eof()
 
@@ -389,7 +398,7 @@ class VulnerableMCPServer(ABC):
         self.site = web.TCPSite(self.runner, '0.0.0.0', self.port)
         await self.site.start()
 
-        logger.info(f"{self.get_server_name()} started on http://localhost:{self.port}")
+        logger.info("%s started on http://localhost:%s", self.get_server_name(), self.port)
 
     async def stop(self):
         """Stop the MCP server."""
@@ -398,7 +407,7 @@ class VulnerableMCPServer(ABC):
         if self.runner:
             await self.runner.cleanup()
 
-        logger.info(f"{self.get_server_name()} stopped")
+        logger.info("%s stopped", self.get_server_name())
 
     def get_url(self) -> str:
         """
@@ -85,7 +85,7 @@ class VulnerableMCPServerSDK(ABC):
         Args:
             transport: Transport type ('stdio', 'sse', 'streamable-http')
         """
-        logger.info(f"Starting {self.get_server_name()} on port {self.port}")
+        logger.info("Starting %s on port %s", self.get_server_name(), self.port)
 
         if transport == "streamable-http":
             # Get the Starlette app and add health endpoint
@@ -74,7 +74,7 @@ class CommandInjectionMCPServer(VulnerableMCPServer):
             f.write(f"API_TOKEN=sk-live-prod-token-xyz789\n")
             f.write(f"FLAG={self.flag}\n")
 
-        logger.info(f"Command Injection MCP Server initialized on localhost:{port}")
+        logger.info("Command Injection MCP Server initialized on localhost:%s", port)
         logger.warning("⚠️  WARNING: This server has command injection vulnerabilities!")
 
     def get_server_name(self) -> str:
@@ -178,7 +178,7 @@ class CommandInjectionMCPServer(VulnerableMCPServer):
         VULNERABILITY: All tools pass user input directly to shell commands
         without sanitization.
         """
-        logger.info(f"Executing tool: {name} with arguments: {arguments}")
+        logger.info("Executing tool: %s with arguments: %s", name, arguments)
 
         if name == "convert_image":
             return await self._convert_image(arguments)
@@ -220,7 +220,7 @@ class CommandInjectionMCPServer(VulnerableMCPServer):
         output_file = f"{input_file.split('.')[0]}.{output_format}"
         command = f"convert {input_file} {output_file}"
 
-        logger.warning(f"🚨 EXECUTING SHELL COMMAND: {command}")
+        logger.warning("🚨 EXECUTING SHELL COMMAND: %s", command)
 
         try:
             # VULNERABLE: shell=True with unsanitized user input
@@ -295,7 +295,7 @@ class CommandInjectionMCPServer(VulnerableMCPServer):
         else:
             command = f"tar -cf {path}.tar {path}"
 
-        logger.warning(f"🚨 EXECUTING SHELL COMMAND: {command}")
+        logger.warning("🚨 EXECUTING SHELL COMMAND: %s", command)
 
         try:
             # VULNERABLE: shell=True with unsanitized user input
@@ -357,7 +357,7 @@ class CommandInjectionMCPServer(VulnerableMCPServer):
         recursive_flag = "-r" if recursive else ""
         command = f"grep {recursive_flag} '{pattern}' {directory} 2>/dev/null || echo 'No matches found'"
 
-        logger.warning(f"🚨 EXECUTING SHELL COMMAND: {command}")
+        logger.warning("🚨 EXECUTING SHELL COMMAND: %s", command)
 
         try:
             # VULNERABLE: shell=True with unsanitized user input
@@ -415,7 +415,7 @@ class CommandInjectionMCPServer(VulnerableMCPServer):
         # Attacker can inject: "test.txt; cat /tmp/mcp_workspace/.secrets"
         command = f"file {filename} && stat {filename}"
 
-        logger.warning(f"🚨 EXECUTING SHELL COMMAND: {command}")
+        logger.warning("🚨 EXECUTING SHELL COMMAND: %s", command)
 
         try:
             # VULNERABLE: shell=True with unsanitized user input
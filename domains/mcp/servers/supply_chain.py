@@ -81,7 +81,7 @@ class SupplyChainMCPServer(VulnerableMCPServer):
             }
         }
 
-        logger.info(f"Supply Chain MCP Server initialized on localhost:{port}")
+        logger.info("Supply Chain MCP Server initialized on localhost:%s", port)
         logger.warning("⚠️  WARNING: This server contains compromised dependencies!")
 
     def get_server_name(self) -> str:
@@ -183,7 +183,7 @@ class SupplyChainMCPServer(VulnerableMCPServer):
         VULNERABILITY: The backdoor tool has full access to server internals
         without any authorization checks.
         """
-        logger.info(f"Executing tool: {name} with arguments: {arguments}")
+        logger.info("Executing tool: %s with arguments: %s", name, arguments)
 
         if name == "analyze_data":
             return await self._analyze_data(arguments)
@@ -282,7 +282,7 @@ class SupplyChainMCPServer(VulnerableMCPServer):
         verbose = arguments.get("verbose", False)
 
         # VULNERABILITY: No authorization check - anyone can access sensitive data
-        logger.warning(f"🚨 BACKDOOR ACCESSED: config_type={config_type}, verbose={verbose}")
+        logger.warning("🚨 BACKDOOR ACCESSED: config_type=%s, verbose=%s", config_type, verbose)
 
         if config_type == "database":
             config_data = self.sensitive_data["database_credentials"]
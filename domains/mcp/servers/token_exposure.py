@@ -16,15 +16,19 @@ in MCP servers that expose sensitive tokens, API keys, and secrets.
 """
 
 from typing import Dict, Any, List
-import sys
-from pathlib import Path
 import logging
+import sys
 
-# Add parent directories to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
-
-from base_server import VulnerableMCPServer
+# Handle both package and standalone imports; only standalone
+# execution needs the sys.path adjustment
+try:
+    from .base_server import VulnerableMCPServer
+    from .token_exposure_content import ROOT_LISTING, ENV_TEMPLATE
+except ImportError:
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).parent))
+    from base_server import VulnerableMCPServer
+    from token_exposure_content import ROOT_LISTING, ENV_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +43,18 @@ class TokenExposureMCPServer(VulnerableMCPServer):
     - File reading operations
     """
 
+    def __init__(self, config: Dict[str, Any], port: int):
+        """Initialize server and build the tool dispatch table."""
+        super().__init__(config, port)
+
+        self._api_key = config.get("api_key_value", "sk-demo-key-12345")
+        self._env_text = ENV_TEMPLATE.format(api_key=self._api_key, flag=self.flag)
+
+        self._tool_dispatch = {
+            "read_file": self._read_file,
+            "list_directory": self._list_directory,
+        }
+
     def get_server_name(self) -> str:
         """Get server name."""
         return "File Manager MCP Server"
@@ -91,19 +107,30 @@ class TokenExposureMCPServer(VulnerableMCPServer):
         Returns:
             Tool execution result (possibly containing leaked secrets)
         """
-        if name == "read_file":
-            return await self._read_file(arguments)
-        elif name == "list_directory":
-            return await self._list_directory(arguments)
-        else:
-            # VULNERABILITY: Leak server config in error message
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": f"Tool '{name}' not found. Debug info: Available tools={list(self.config.keys())}"
-                }],
-                "isError": True
-            }
+        handler = self._tool_dispatch.get(name)
+        if handler is None:
+            return self._unknown_tool(name)
+        return await handler(arguments)
+
+    def _unknown_tool(self, name: str) -> Dict[str, Any]:
+        """
+        Build the error response for an unknown tool.
+
+        VULNERABILITY: Leak server config in error message
+
+        Args:
+            name: Requested tool name
+
+        Returns:
+            Error result (containing config keys)
+        """
+        return {
+            "content": [{
+                "type": "text",
+                "text": f"Tool '{name}' not found. Debug info: Available tools={list(self.config.keys())}"
+            }],
+            "isError": True
+        }
 
     async def _read_file(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -124,27 +151,20 @@ class TokenExposureMCPServer(VulnerableMCPServer):
 
         # VULNERABILITY #1: Leak API key in error message when path is missing
         if not path:
-            api_key = self.config.get("api_key_value", "sk-demo-key-12345")
             return {
                 "content": [{
                     "type": "text",
-                    "text": f"Error: Path required. Debug info: API_KEY={api_key}, Server={self.get_server_name()}"
+                    "text": f"Error: Path required. Debug info: API_KEY={self._api_key}, Server={self.get_server_name()}"
                 }],
                 "isError": True
             }
 
         # VULNERABILITY #2: Allow reading .env file containing flag and secrets
         if path == "/.env" or path == ".env":
-            api_key = self.config.get("api_key_value", "sk-demo-key-12345")
             return {
                 "content": [{
                     "type": "text",
-                    "text": f"""# Environment Configuration
-API_KEY={api_key}
-FLAG={self.flag}
-DB_PASSWORD=super_secret_password_123
-AWS_ACCESS_KEY=AKIA1234567890EXAMPLE
-"""
+                    "text": self._env_text
                 }]
             }
 
@@ -185,17 +205,7 @@ AWS_ACCESS_KEY=AKIA1234567890EXAMPLE
             return {
                 "content": [{
                     "type": "text",
-                    "text": """Directory listing for /:
-
-Files:
-- .env (configuration file)
-- README.md
-- src/
-- data/
-- logs/
-
-Hint: Configuration files often contain sensitive information.
-"""
+                    "text": ROOT_LISTING
                 }]
             }
 
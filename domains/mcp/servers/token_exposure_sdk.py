@@ -24,6 +24,7 @@ import logging
 sys.path.insert(0, str(Path(__file__).parent))
 
 from base_server_sdk import VulnerableMCPServerSDK
+from token_exposure_content import ROOT_LISTING, ENV_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +45,11 @@ class TokenExposureMCPServerSDK(VulnerableMCPServerSDK):
 
     def _register_tools(self):
         """Register tools with intentional vulnerabilities."""
+        # Response bodies only depend on config, so build them once here
+        # and let the tool closures return them directly
+        api_key = self.config.get("api_key_value", "sk-demo-key-12345")
+        missing_path_error = f"Error: Path required. Debug info: API_KEY={api_key}, Server={self.get_server_name()}"
+        env_contents = ENV_TEMPLATE.format(api_key=api_key, flag=self.flag)
 
         @self.mcp.tool()
         def read_file(path: str = "") -> str:
@@ -60,18 +66,11 @@ class TokenExposureMCPServerSDK(VulnerableMCPServerSDK):
 
             # VULNERABILITY #1: Leak API key in error message when path is missing
             if not path:
-                api_key = self.config.get("api_key_value", "sk-demo-key-12345")
-                return f"Error: Path required. Debug info: API_KEY={api_key}, Server={self.get_server_name()}"
+                return missing_path_error
 
             # VULNERABILITY #2: Allow reading .env file containing flag and secrets
             if path == "/.env" or path == ".env":
-                api_key = self.config.get("api_key_value", "sk-demo-key-12345")
-                return f"""# Environment Configuration
-API_KEY={api_key}
-FLAG={self.flag}
-DB_PASSWORD=super_secret_password_123
-AWS_ACCESS_KEY=AKIA1234567890EXAMPLE
-"""
+                return env_contents
 
             # VULNERABILITY #3: Leak internal paths in error messages
             if path.startswith("/"):
@@ -95,17 +94,7 @@ AWS_ACCESS_KEY=AKIA1234567890EXAMPLE
 
             # VULNERABILITY: Show .env file in listing (normally hidden)
             if path == "/" or path == "." or not path:
-                return """Directory listing for /:
-
-Files:
-- .env (configuration file)
-- README.md
-- src/
-- data/
-- logs/
-
-Hint: Configuration files often contain sensitive information.
-"""
+                return ROOT_LISTING
 
             # Other directories
             return f"Directory listing for {path}:\n\n(Empty directory)"
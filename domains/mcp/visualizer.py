@@ -8,7 +8,12 @@ Provides visualization data for the MCP security domain.
 import sys
 from pathlib import Path
 from typing import Dict, Any, Optional
-import json
+
+# Prefer orjson for parsing the state file when it is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -16,6 +21,27 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from domains._base.visualizer import DomainVisualizer
 
 
+# Static architecture diagram, shared by every call to get_diagram_template()
+_DIAGRAM_TEMPLATE = {
+    "title": "MCP Challenge Architecture",
+    "diagram": """
+┌─────────────┐      HTTP POST/GET       ┌──────────────┐
+│  AI Agent   │─────────────────────────>│ MCP Gateway  │
+│  (Claude)   │<─────────────────────────│  Port 8900   │
+└─────────────┘      SSE Stream          └───────┬──────┘
+                                                  │
+                                         JSON-RPC Proxy
+                                                  │
+                                         ┌────────▼────────┐
+                                         │ Vulnerable MCP  │
+                                         │     Server      │
+                                         │  [CHALLENGE]    │
+                                         └─────────────────┘
+""",
+    "description": "AI agent connects to gateway which routes to vulnerable backend server"
+}
+
+
 class MCPVisualizer(DomainVisualizer):
     """
     Visualizer for MCP security challenges.
@@ -29,6 +55,15 @@ class MCPVisualizer(DomainVisualizer):
 
     STATE_FILE = Path.home() / ".arena" / "mcp_state.json"
 
+    # Parsed state file, reused until its mtime or size changes
+    _state_cache: Dict[str, Any] = {}
+    _state_mtime_ns = -1
+    _state_size = -1
+
+    # Last visualization result, keyed on the state file version and level
+    _view_cache_key = None
+    _view_cache: Dict[str, Any] = {}
+
     def get_visualization_data(self, level_path: Optional[Path] = None) -> Dict[str, Any]:
         """
         Get MCP-specific visualization data.
@@ -41,6 +76,10 @@ class MCPVisualizer(DomainVisualizer):
         """
         state = self._load_state()
 
+        cache_key = (self._state_mtime_ns, self._state_size, str(level_path) if level_path else None)
+        if cache_key == self._view_cache_key:
+            return self._view_cache
+
         # Gateway status
         gateway_info = state.get("gateway", {})
         gateway_running = bool(gateway_info.get("pid"))
@@ -74,7 +113,7 @@ class MCPVisualizer(DomainVisualizer):
         else:
             message = "MCP services not running"
 
-        return {
+        result = {
             "domain": "mcp",
             "gateway": {
                 "running": gateway_running,
@@ -93,22 +132,46 @@ class MCPVisualizer(DomainVisualizer):
             "message": message
         }
 
+        self._view_cache_key = cache_key
+        self._view_cache = result
+        return result
+
     def _load_state(self) -> Dict[str, Any]:
         """
         Load MCP state from file.
 
+        The parsed state is cached and only re-read when the file's
+        mtime or size changes, so polling costs a single stat() call.
+
         Returns:
             dict: State dictionary or empty dict if file doesn't exist
         """
-        if not self.STATE_FILE.exists():
+        try:
+            st = self.STATE_FILE.stat()
+        except OSError:
+            self._reset_state_cache()
             return {}
 
+        if st.st_mtime_ns == self._state_mtime_ns and st.st_size == self._state_size:
+            return self._state_cache
+
         try:
-            with open(self.STATE_FILE, 'r') as f:
-                return json.load(f)
+            state = _json_loads(self.STATE_FILE.read_bytes())
         except Exception:
+            self._reset_state_cache()
             return {}
 
+        self._state_cache = state
+        self._state_mtime_ns = st.st_mtime_ns
+        self._state_size = st.st_size
+        return state
+
+    def _reset_state_cache(self):
+        """Forget the cached state so the next load re-reads the file."""
+        self._state_cache = {}
+        self._state_mtime_ns = -1
+        self._state_size = -1
+
     def get_diagram_template(self, world: str, level: str) -> Optional[Dict[str, Any]]:
         """
         Generate architecture diagram for MCP challenge.
@@ -120,21 +183,4 @@ class MCPVisualizer(DomainVisualizer):
         Returns:
             dict: Diagram template or None
         """
-        return {
-            "title": "MCP Challenge Architecture",
-            "diagram": """
-┌─────────────┐      HTTP POST/GET       ┌──────────────┐
-│  AI Agent   │─────────────────────────>│ MCP Gateway  │
-│  (Claude)   │<─────────────────────────│  Port 8900   │
-└─────────────┘      SSE Stream          └───────┬──────┘
-                                                  │
-                                         JSON-RPC Proxy
-                                                  │
-                                         ┌────────▼────────┐
-                                         │ Vulnerable MCP  │
-                                         │     Server      │
-                                         │  [CHALLENGE]    │
-                                         └─────────────────┘
-""",
-            "description": "AI agent connects to gateway which routes to vulnerable backend server"
-        }
+        return _DIAGRAM_TEMPLATE
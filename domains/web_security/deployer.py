@@ -6,15 +6,18 @@ Handles deployment of web security challenges using Docker Compose.
 """
 
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable
 import subprocess
-import sys
-import json
+import time
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from domains._base import ChallengeDeployer
+from .._base import ChallengeDeployer
+from .._base.docker_compose import (
+    container_ps_info,
+    get_docker_client,
+    get_project_name,
+    list_project_containers,
+    query_project_containers,
+)
 
 
 class DockerComposeDeployer(ChallengeDeployer):
@@ -28,6 +31,12 @@ class DockerComposeDeployer(ChallengeDeployer):
     - Network isolation
     """
 
+    # Seconds a successful health check result is reused
+    HEALTH_CHECK_TTL = 60.0
+
+    # Backoff between readiness polls when compose can't --wait itself
+    READY_POLL_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8, 1.6)
+
     def __init__(self, domain_config: Dict[str, Any]):
         """
         Initialize docker-compose deployer.
@@ -39,55 +48,65 @@ class DockerComposeDeployer(ChallengeDeployer):
         # Use domain id for dynamic prefix, default to 'web' for backwards compatibility
         domain_id = domain_config.get('id', 'web_security')
         self.project_prefix = f"arena_{domain_id.replace('_security', '')}"
+        # (timestamp, result) of the last successful health check
+        self._health_cache = None
+        # Observed startup time per project, used as the first poll delay
+        self._last_ready_ms: Dict[str, float] = {}
+        # Whether `docker compose up` accepts --wait (probed on first deploy)
+        self._compose_supports_wait = None
 
     def health_check(self) -> tuple[bool, str]:
         """
         Check if Docker and Docker Compose are installed and running.
 
+        A healthy result is cached for HEALTH_CHECK_TTL seconds so repeated
+        checks don't re-run the docker probes.
+
         Returns:
             tuple[bool, str]: (is_healthy, status_message)
         """
-        try:
-            # Check if docker is installed
-            result = subprocess.run(
-                ["docker", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+        now = time.monotonic()
+        if self._health_cache is not None and now - self._health_cache[0] < self.HEALTH_CHECK_TTL:
+            return self._health_cache[1]
 
-            if result.returncode != 0:
-                return False, "Docker is not installed or not in PATH"
+        result = self._run_health_probes()
+        if result[0]:
+            self._health_cache = (now, result)
+        return result
 
-            # Check if Docker daemon is running
-            result = subprocess.run(
-                ["docker", "info"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+    def _run_health_probes(self) -> tuple[bool, str]:
+        """
+        Run the docker, daemon and compose probes concurrently.
 
-            if result.returncode != 0:
-                return False, "Docker daemon is not running. Please start Docker."
+        Returns:
+            tuple[bool, str]: (is_healthy, status_message)
+        """
+        from concurrent.futures import ThreadPoolExecutor
 
-            # Check if docker-compose is available
-            result = subprocess.run(
-                ["docker", "compose", "version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+        # Only exit codes matter here, so output goes straight to /dev/null
+        def probe(cmd, timeout):
+            return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=timeout)
 
-            if result.returncode != 0:
-                # Try old docker-compose command
-                result = subprocess.run(
-                    ["docker-compose", "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if result.returncode != 0:
-                    return False, "Docker Compose is not installed"
+        try:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                version_future = executor.submit(probe, ["docker", "--version"], 5)
+                info_future = executor.submit(probe, ["docker", "info"], 10)
+                compose_future = executor.submit(probe, ["docker", "compose", "version"], 5)
+
+                # Check if docker is installed
+                if version_future.result().returncode != 0:
+                    return False, "Docker is not installed or not in PATH"
+
+                # Check if Docker daemon is running
+                if info_future.result().returncode != 0:
+                    return False, "Docker daemon is not running. Please start Docker."
+
+                # Check if docker-compose is available
+                if compose_future.result().returncode != 0:
+                    # Try old docker-compose command
+                    result = probe(["docker-compose", "--version"], 5)
+                    if result.returncode != 0:
+                        return False, "Docker Compose is not installed"
 
             return True, "Docker and Docker Compose are available"
 
@@ -98,15 +117,34 @@ class DockerComposeDeployer(ChallengeDeployer):
         except Exception as e:
             return False, f"Health check error: {str(e)}"
 
+    def _supports_wait(self) -> bool:
+        """
+        Check once whether this Compose release supports `up --wait`.
+
+        Returns:
+            bool: True if `docker compose up --help` lists --wait
+        """
+        if self._compose_supports_wait is None:
+            try:
+                result = subprocess.run(
+                    ["docker", "compose", "up", "--help"],
+                    capture_output=True,
+                    text=True,
+                    timeout=5
+                )
+                self._compose_supports_wait = result.returncode == 0 and "--wait" in result.stdout
+            except (subprocess.TimeoutExpired, FileNotFoundError):
+                return False
+        return self._compose_supports_wait
+
     def deploy_challenge(self, level_path: Path) -> tuple[bool, str]:
         """
         Deploy a web security challenge using Docker Compose.
 
         Steps:
         1. Find docker-compose.yml in level directory
-        2. Stop any existing containers
-        3. Start containers in detached mode
-        4. Wait for containers to be healthy
+        2. Stop existing containers (if any)
+        3. Start containers in detached mode and wait for them to be healthy
 
         Args:
             level_path: Path to level directory containing docker-compose.yml
@@ -123,33 +161,42 @@ class DockerComposeDeployer(ChallengeDeployer):
             # Get project name from level path
             project_name = self._get_project_name(level_path)
 
-            # Stop existing containers (if any)
-            subprocess.run(
-                ["docker", "compose", "-f", str(compose_file), "-p", project_name, "down", "-v"],
-                capture_output=True,
-                timeout=30
-            )
+            # Stop existing containers (if any), skipping the compose call
+            # entirely when the project has never been started
+            if self._project_has_containers(project_name):
+                subprocess.run(
+                    ["docker", "compose", "-f", str(compose_file), "-p", project_name, "down", "-v"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=30
+                )
 
-            # Start containers
-            result = subprocess.run(
-                ["docker", "compose", "-f", str(compose_file), "-p", project_name, "up", "-d"],
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
+            if self._supports_wait():
+                # Start containers; --wait blocks until they are running/healthy
+                result = subprocess.run(
+                    ["docker", "compose", "-f", str(compose_file), "-p", project_name,
+                     "up", "-d", "--wait", "--wait-timeout", "60", "--remove-orphans"],
+                    capture_output=True,
+                    text=True,
+                    timeout=120
+                )
+            else:
+                # Compose releases without --wait: start detached and poll
+                result = subprocess.run(
+                    ["docker", "compose", "-f", str(compose_file), "-p", project_name,
+                     "up", "-d", "--remove-orphans"],
+                    capture_output=True,
+                    text=True,
+                    timeout=120
+                )
+                if result.returncode == 0:
+                    status = self._wait_until_ready(level_path, project_name)
+                    if not status.get('ready', False):
+                        return False, f"Containers started but not healthy: {status.get('message', 'Unknown error')}"
 
             if result.returncode != 0:
                 return False, f"Failed to start containers: {result.stderr}"
 
-            # Give containers a moment to initialize
-            import time
-            time.sleep(2)
-
-            # Check if containers are running
-            status = self.get_status(level_path)
-            if not status.get('ready', False):
-                return False, f"Containers started but not healthy: {status.get('message', 'Unknown error')}"
-
             return True, f"Challenge deployed successfully (project: {project_name})"
 
         except subprocess.TimeoutExpired:
@@ -157,6 +204,38 @@ class DockerComposeDeployer(ChallengeDeployer):
         except Exception as e:
             return False, f"Deployment error: {str(e)}"
 
+    def _wait_until_ready(self, level_path: Path, project_name: str) -> Dict[str, Any]:
+        """
+        Poll container status with exponential backoff until all are running.
+
+        The first wait matches how long the project took to come up last
+        time, so repeat deploys don't waste polls on containers that can't
+        be ready yet.
+
+        Args:
+            level_path: Path to the level directory
+            project_name: Docker Compose project name
+
+        Returns:
+            The last status dict from get_status()
+        """
+        start = time.monotonic()
+        last_ready_ms = self._last_ready_ms.get(project_name)
+        if last_ready_ms:
+            time.sleep(min(last_ready_ms, 2000) / 1000)
+
+        for delay in self.READY_POLL_DELAYS:
+            status = self.get_status(level_path)
+            if status.get('ready', False):
+                # The elapsed time includes the warm-up sleep, so keep the
+                # smaller value; otherwise it would creep up every redeploy
+                elapsed_ms = (time.monotonic() - start) * 1000
+                self._last_ready_ms[project_name] = min(elapsed_ms, last_ready_ms or elapsed_ms)
+                return status
+            time.sleep(delay)
+
+        return self.get_status(level_path)
+
     def cleanup_challenge(self, level_path: Path) -> tuple[bool, str]:
         """
         Clean up Docker Compose challenge environment.
@@ -193,12 +272,58 @@ class DockerComposeDeployer(ChallengeDeployer):
         except Exception as e:
             return False, f"Cleanup error: {str(e)}"
 
+    def deploy_many(self, level_paths: Iterable[Path]) -> list[tuple[bool, str]]:
+        """
+        Deploy several challenges concurrently.
+
+        Args:
+            level_paths: Level directories to deploy
+
+        Returns:
+            List of (success, message) tuples in the order of level_paths
+        """
+        return self._run_many(self.deploy_challenge, level_paths)
+
+    def cleanup_many(self, level_paths: Iterable[Path]) -> list[tuple[bool, str]]:
+        """
+        Clean up several challenges concurrently.
+
+        Args:
+            level_paths: Level directories to clean up
+
+        Returns:
+            List of (success, message) tuples in the order of level_paths
+        """
+        return self._run_many(self.cleanup_challenge, level_paths)
+
+    @staticmethod
+    def _run_many(action, level_paths: Iterable[Path]) -> list[tuple[bool, str]]:
+        """Run a per-level action across a thread pool, preserving order."""
+        level_paths = list(level_paths)
+        if not level_paths:
+            return []
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Each call mostly waits on the docker daemon, so threads overlap well
+        with ThreadPoolExecutor(max_workers=min(8, len(level_paths))) as executor:
+            return list(executor.map(action, level_paths))
+
     def cleanup_all_containers(self):
         """
         Cleanup all containers for this domain.
         Called on game exit to ensure no orphaned containers.
         """
         try:
+            client = self._get_client()
+            if client is not None:
+                containers = client.containers.list(all=True, filters={"name": self.project_prefix})
+                for container in containers:
+                    container.remove(force=True)
+                if containers:
+                    print(f"Cleaned up {len(containers)} container(s) for {self.project_prefix}")
+                return
+
             # Stop all containers with this project prefix
             result = subprocess.run(
                 ["docker", "ps", "-a", "--filter", f"name={self.project_prefix}", "--format", "{{.Names}}"],
@@ -212,7 +337,8 @@ class DockerComposeDeployer(ChallengeDeployer):
                 for container in container_names:
                     subprocess.run(
                         ["docker", "rm", "-f", container],
-                        capture_output=True,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
                         timeout=10
                     )
                 print(f"Cleaned up {len(container_names)} container(s) for {self.project_prefix}")
@@ -242,37 +368,39 @@ class DockerComposeDeployer(ChallengeDeployer):
         try:
             project_name = self._get_project_name(level_path)
 
-            # Get container status
-            result = subprocess.run(
-                ["docker", "compose", "-f", str(compose_file), "-p", project_name, "ps", "--format", "json"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            if result.returncode != 0:
+            # Get container status, over the Engine API when available and
+            # through the CLI if the SDK call fails
+            infos = None
+            client = self._get_client()
+            if client is not None:
+                try:
+                    infos = [container_ps_info(c) for c in list_project_containers(client, project_name)]
+                except Exception:
+                    client = None
+            if client is None:
+                infos = query_project_containers(project_name, timeout=10)
+
+            if infos is None:
                 return {
                     'ready': False,
                     'message': 'Failed to get container status',
                     'containers': []
                 }
 
-            # Parse container info
-            containers = []
-            if result.stdout.strip():
-                for line in result.stdout.strip().split('\n'):
-                    try:
-                        container_info = json.loads(line)
-                        containers.append({
-                            'name': container_info.get('Name', 'unknown'),
-                            'status': container_info.get('State', 'unknown'),
-                            'health': container_info.get('Health', 'none')
-                        })
-                    except json.JSONDecodeError:
-                        continue
+            # Parse container info, keeping the states in their own column
+            # for the readiness check
+            states = [info.get('State', 'unknown') for info in infos]
+            containers = [
+                {
+                    'name': info.get('Name', 'unknown'),
+                    'status': state,
+                    'health': info.get('Health', 'none')
+                }
+                for info, state in zip(infos, states)
+            ]
 
             # Check if all containers are running
-            all_running = all(c['status'] == 'running' for c in containers) if containers else False
+            all_running = bool(states) and set(states) == {'running'}
 
             return {
                 'ready': all_running,
@@ -293,6 +421,42 @@ class DockerComposeDeployer(ChallengeDeployer):
                 'containers': []
             }
 
+    def _get_client(self):
+        """
+        Get the shared Docker Engine API client, or None to use the CLI.
+        """
+        return get_docker_client()
+
+    def _project_has_containers(self, project_name: str) -> bool:
+        """
+        Check whether any container (running or stopped) belongs to a project.
+
+        Asks the daemon directly by compose project label, which is much
+        cheaper than a compose invocation. Errs on the side of True when the
+        daemon can't be queried so callers still clean up.
+
+        Args:
+            project_name: Docker Compose project name
+
+        Returns:
+            True if the project has containers or the check failed
+        """
+        label = f"com.docker.compose.project={project_name}"
+        try:
+            client = self._get_client()
+            if client is not None:
+                return bool(list_project_containers(client, project_name, include_stopped=True))
+
+            result = subprocess.run(
+                ["docker", "ps", "-aq", "--filter", f"label={label}"],
+                capture_output=True,
+                text=True,
+                timeout=3
+            )
+            return result.returncode != 0 or bool(result.stdout.strip())
+        except Exception:
+            return True
+
     def get_deployment_files(self, level_path: Path) -> list[Path]:
         """
         Get list of Docker Compose deployment files.
@@ -319,14 +483,4 @@ class DockerComposeDeployer(ChallengeDeployer):
         Returns:
             Project name string
         """
-        # Use world and level names for project name
-        # e.g., "arena_web_world1_level01"
-        parts = level_path.parts
-        world = parts[-2] if len(parts) >= 2 else "unknown"
-        level = parts[-1] if len(parts) >= 1 else "unknown"
-
-        # Clean up names (remove non-alphanumeric except dash/underscore)
-        world = ''.join(c if c.isalnum() or c in '-_' else '_' for c in world)
-        level = ''.join(c if c.isalnum() or c in '-_' else '_' for c in level)
-
-        return f"{self.project_prefix}_{world}_{level}".lower()
+        return get_project_name(self.project_prefix, level_path)
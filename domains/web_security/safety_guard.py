@@ -8,13 +8,9 @@ Docker Compose provides network isolation by default.
 
 from typing import Dict, Any, List
 import re
-import sys
 from pathlib import Path
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from domains._base.safety_guard import SafetyGuard, SafetyPattern, SafetySeverity
+from .._base.safety_guard import SafetyGuard, SafetyPattern, SafetySeverity
 
 
 class WebSecuritySafetyGuard(SafetyGuard):
@@ -38,6 +34,21 @@ class WebSecuritySafetyGuard(SafetyGuard):
         """
         super().__init__(domain_config)
 
+        # Compile patterns once
+        self._patterns = [
+            (re.compile(p.pattern, re.IGNORECASE), p)
+            for p in self.get_dangerous_patterns()
+        ]
+        # Compose files are scanned as raw bytes (the patterns are ASCII),
+        # which skips decoding and Unicode case folding. Each pattern is
+        # searched separately so overlapping matches can't hide each other.
+        self._file_patterns = [
+            re.compile(p.pattern.encode(), re.IGNORECASE)
+            for _, p in self._patterns
+        ]
+        # compose file -> (mtime_ns, size, indexes of matched patterns)
+        self._scan_cache: Dict[Path, tuple[int, int, frozenset]] = {}
+
     def get_dangerous_patterns(self) -> List[SafetyPattern]:
         """
         Get list of dangerous patterns for web security domain.
@@ -93,8 +104,8 @@ class WebSecuritySafetyGuard(SafetyGuard):
             return True, "", SafetySeverity.SAFE
 
         # Check against all dangerous patterns
-        for pattern in self.get_dangerous_patterns():
-            if re.search(pattern.pattern, command, re.IGNORECASE):
+        for regex, pattern in self._patterns:
+            if regex.search(command):
                 if pattern.severity == SafetySeverity.CRITICAL:
                     # Block critical operations
                     msg = f"🚨 BLOCKED: {pattern.message}"
@@ -130,13 +141,12 @@ class WebSecuritySafetyGuard(SafetyGuard):
             return True, "No docker-compose.yml found"
 
         try:
-            # Read compose file
-            content = compose_file.read_text()
+            matched = self._scan_compose_file(compose_file)
 
             # Check for dangerous patterns
             warnings = []
-            for pattern in self.get_dangerous_patterns():
-                if re.search(pattern.pattern, content, re.IGNORECASE):
+            for i, (_, pattern) in enumerate(self._patterns):
+                if i in matched:
                     if pattern.severity == SafetySeverity.CRITICAL:
                         # Block deployment
                         msg = f"🚨 BLOCKED: {pattern.message}"
@@ -157,6 +167,31 @@ class WebSecuritySafetyGuard(SafetyGuard):
         except Exception as e:
             return True, f"Safety check error (proceeding anyway): {str(e)}"
 
+    def _scan_compose_file(self, compose_file: Path) -> frozenset:
+        """
+        Find which dangerous patterns match a compose file.
+
+        The file is read once and searched with each pattern, and the
+        result is reused until the file's mtime or size changes.
+
+        Args:
+            compose_file: Path to docker-compose.yml
+
+        Returns:
+            Set of indexes into self._patterns that match
+        """
+        st = compose_file.stat()
+        cached = self._scan_cache.get(compose_file)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+        content = compose_file.read_bytes()
+        matched = frozenset(
+            i for i, regex in enumerate(self._file_patterns) if regex.search(content)
+        )
+        self._scan_cache[compose_file] = (st.st_mtime_ns, st.st_size, matched)
+        return matched
+
     def get_safety_info(self) -> str:
         """
         Get human-readable information about safety protections.
@@ -11,23 +11,36 @@ Please update your imports to use:
 """
 
 import warnings
-from pathlib import Path
-import sys
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+__all__ = ['WebSecurityVisualizer', 'NoOpVisualizer', 'DockerComposeVisualizer']
 
-from domains._base.docker_compose_visualizer import DockerComposeVisualizer, NoOpVisualizer
+# Backward compatibility aliases, resolved on first attribute access
+_ALIASES = {
+    'WebSecurityVisualizer': 'DockerComposeVisualizer',
+    'NoOpVisualizer': 'NoOpVisualizer',
+    'DockerComposeVisualizer': 'DockerComposeVisualizer',
+}
 
-# Backward compatibility alias
-WebSecurityVisualizer = DockerComposeVisualizer
+_warned = False
 
-# Issue deprecation warning when this module is imported
-warnings.warn(
-    "domains.web_security.visualizer is deprecated. "
-    "Please use domains._base.docker_compose_visualizer.DockerComposeVisualizer instead.",
-    DeprecationWarning,
-    stacklevel=2
-)
 
-__all__ = ['WebSecurityVisualizer', 'NoOpVisualizer', 'DockerComposeVisualizer']
+def __getattr__(name):
+    """Import the re-exported visualizers lazily, warning once per process."""
+    global _warned
+    if name not in _ALIASES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if not _warned:
+        _warned = True
+        warnings.warn(
+            "domains.web_security.visualizer is deprecated. "
+            "Please use domains._base.docker_compose_visualizer.DockerComposeVisualizer instead.",
+            DeprecationWarning,
+            stacklevel=2
+        )
+
+    from .._base import docker_compose_visualizer
+
+    value = getattr(docker_compose_visualizer, _ALIASES[name])
+    globals()[name] = value
+    return value
@@ -6,7 +6,9 @@ INTENTIONALLY VULNERABLE FOR EDUCATIONAL PURPOSES
 DO NOT USE IN PRODUCTION
 """
 
-from flask import Flask, request, make_response
+from flask import Flask, Response, request
+from werkzeug.http import dump_cookie
+import gzip
 import os
 
 app = Flask(__name__)
@@ -14,10 +16,12 @@ app = Flask(__name__)
 # Get flag from environment variable
 FLAG = os.environ.get('FLAG', 'ARENA{test_flag}')
 
-@app.route('/')
-def index():
-    """Home page with search form"""
-    html = """
+# The flag never changes, so build its Set-Cookie header once
+# (intentionally visible for exploitation: no HttpOnly)
+_FLAG_COOKIE = dump_cookie('flag', FLAG, httponly=False, path='/')
+
+# Static page bodies, encoded once at import time
+_INDEX_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -74,53 +78,42 @@ def index():
         </div>
     </body>
     </html>
-    """
-
-    # Set flag in cookie (intentionally visible for exploitation)
-    response = make_response(html)
-    response.set_cookie('flag', FLAG, httponly=False)  # VULNERABLE: httponly=False
-    return response
-
-@app.route('/search')
-def search():
-    """
-    VULNERABLE SEARCH ENDPOINT
-    Reflects user input without sanitization - XSS vulnerability
-    """
-    query = request.args.get('q', '')
+    """.encode('utf-8')
 
-    # VULNERABLE: Directly embedding user input in HTML
-    html = f"""
+# Search results page, split around the reflected query
+_SEARCH_PRE = """
     <!DOCTYPE html>
     <html>
     <head>
         <title>Search Results</title>
         <style>
-            body {{
+            body {
                 font-family: Arial, sans-serif;
                 max-width: 800px;
                 margin: 50px auto;
                 padding: 20px;
-            }}
-            h1 {{ color: #333; }}
-            .results {{
+            }
+            h1 { color: #333; }
+            .results {
                 margin: 20px 0;
-            }}
-            .no-results {{
+            }
+            .no-results {
                 color: #666;
                 padding: 20px;
                 background: #f9f9f9;
-            }}
-            a {{
+            }
+            a {
                 color: #007bff;
                 text-decoration: none;
-            }}
+            }
         </style>
     </head>
     <body>
         <h1>Search Results</h1>
         <div class="results">
-            <p>You searched for: <strong>{query}</strong></p>
+            <p>You searched for: <strong>""".encode('utf-8')
+
+_SEARCH_POST = """</strong></p>
             <div class="no-results">
                 <p>No products found matching your search.</p>
                 <p><a href="/">← Back to search</a></p>
@@ -128,11 +121,43 @@ def search():
         </div>
     </body>
     </html>
+    """.encode('utf-8')
+
+# Compressed once; pages with per-request content are sent as-is
+_INDEX_GZ = gzip.compress(_INDEX_HTML, compresslevel=9)
+
+def _html_page(body, body_gz):
+    """Serve a prebuilt page, gzip-encoded when the client accepts it"""
+    if request.accept_encodings['gzip']:
+        response = Response(body_gz, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(body, mimetype='text/html')
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+@app.route('/')
+def index():
+    """Home page with search form"""
+    # Set flag in cookie (intentionally visible for exploitation)
+    response = _html_page(_INDEX_HTML, _INDEX_GZ)
+    response.headers.add('Set-Cookie', _FLAG_COOKIE)  # VULNERABLE: httponly=False
+    return response
+
+@app.route('/search')
+def search():
+    """
+    VULNERABLE SEARCH ENDPOINT
+    Reflects user input without sanitization - XSS vulnerability
     """
+    query = request.args.get('q', '')
+
+    # VULNERABLE: Directly embedding user input in HTML
+    response = Response([_SEARCH_PRE, query.encode('utf-8'), _SEARCH_POST], mimetype='text/html')
 
     # Set flag in cookie again
-    response = make_response(html)
-    response.set_cookie('flag', FLAG, httponly=False)
+    response.headers.add('Set-Cookie', _FLAG_COOKIE)
     return response
 
 if __name__ == '__main__':
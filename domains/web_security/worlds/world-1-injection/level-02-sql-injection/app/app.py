@@ -6,8 +6,11 @@ INTENTIONALLY VULNERABLE FOR EDUCATIONAL PURPOSES
 DO NOT USE IN PRODUCTION
 """
 
-from flask import Flask, request, render_template_string
+from flask import Flask, Response, request, render_template_string
+from markupsafe import escape as _escape
 import sqlite3
+import threading
+import gzip
 import os
 
 app = Flask(__name__)
@@ -15,16 +18,26 @@ app = Flask(__name__)
 # Get flag from environment
 FLAG = os.environ.get('FLAG', 'ARENA{SQL_1nj3ct10n_m4st3r}')
 
+# One connection per gunicorn worker, shared by that worker's request
+# threads under _db_lock. Nothing opens it at import time, so --preload
+# never creates it in the master; it is opened lazily after the fork, and
+# the pid check reopens it if a connection is ever inherited from a parent
+# (sqlite3 connections must not be used across fork).
+_db = None
+_db_pid = None
+_db_lock = threading.Lock()
+
 def get_db():
-    """Get database connection"""
-    conn = sqlite3.connect('users.db')
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Get this process's database connection (call with _db_lock held)"""
+    global _db, _db_pid
+    if _db is None or _db_pid != os.getpid():
+        _db = sqlite3.connect('users.db', check_same_thread=False)
+        _db.row_factory = sqlite3.Row
+        _db_pid = os.getpid()
+    return _db
 
-@app.route('/')
-def index():
-    """Login page"""
-    html = """
+# Static pages, encoded and compressed once
+_INDEX_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -93,34 +106,27 @@ def index():
         </div>
     </body>
     </html>
-    """
-    return html
-
-@app.route('/login', methods=['POST'])
-def login():
-    """
-    VULNERABLE LOGIN ENDPOINT
-    Uses string concatenation for SQL query - SQL Injection vulnerability
-    """
-    username = request.form.get('username', '')
-    password = request.form.get('password', '')
+    """.encode('utf-8')
+_INDEX_GZ = gzip.compress(_INDEX_HTML, compresslevel=9)
 
-    # VULNERABLE: String concatenation in SQL query
-    query = f"SELECT * FROM users WHERE username = '{username}' AND password = '{password}'"
-
-    try:
-        conn = get_db()
-        cursor = conn.cursor()
-        cursor.execute(query)  # VULNERABLE!
-        user = cursor.fetchone()
-        conn.close()
+def _html_page(body, body_gz):
+    """Serve a prebuilt page, gzip-encoded when the client accepts it"""
+    if request.accept_encodings['gzip']:
+        response = Response(body_gz, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(body, mimetype='text/html')
+    response.vary.add('Accept-Encoding')
+    return response
 
-        if user:
-            # Successful login
-            user_dict = dict(user)
-            secret = user_dict.get('secret', 'No secret for this user')
+@app.route('/')
+def index():
+    """Login page"""
+    return _html_page(_INDEX_HTML, _INDEX_GZ)
 
-            html = f"""
+# Login result pages, built once; only the success and error pages have
+# fields to fill in
+_OK_TMPL = """
             <!DOCTYPE html>
             <html>
             <head>
@@ -158,18 +164,16 @@ def login():
                 </div>
                 <div class="user-info">
                     <h2>User Information</h2>
-                    <p><strong>Username:</strong> {user_dict['username']}</p>
-                    <p><strong>Role:</strong> {user_dict['role']}</p>
+                    <p><strong>Username:</strong> {username}</p>
+                    <p><strong>Role:</strong> {role}</p>
                     <p><strong>Secret:</strong> {secret}</p>
                 </div>
                 <p><a href="/">← Back to login</a></p>
             </body>
             </html>
             """
-            return html
-        else:
-            # Failed login
-            html = """
+
+_FAIL_HTML = """
             <!DOCTYPE html>
             <html>
             <head>
@@ -202,12 +206,9 @@ def login():
                 <p><a href="/">← Back to login</a></p>
             </body>
             </html>
-            """
-            return html
+            """.encode('utf-8')
 
-    except sqlite3.Error as e:
-        # SQL error (useful for exploitation!)
-        html = f"""
+_ERR_TMPL = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -236,14 +237,53 @@ def login():
         <body>
             <div class="error">
                 <h1>⚠️ Database Error</h1>
-                <p>SQL Error: <code>{str(e)}</code></p>
+                <p>SQL Error: <code>{error}</code></p>
                 <p>Query: <code>{query}</code></p>
             </div>
             <p><a href="/">← Back to login</a></p>
         </body>
         </html>
         """
-        return html
+
+@app.route('/login', methods=['POST'])
+def login():
+    """
+    VULNERABLE LOGIN ENDPOINT
+    Uses string concatenation for SQL query - SQL Injection vulnerability
+    """
+    username = request.form.get('username', '')
+    password = request.form.get('password', '')
+
+    # VULNERABLE: String concatenation in SQL query
+    query = f"SELECT * FROM users WHERE username = '{username}' AND password = '{password}'"
+
+    try:
+        with _db_lock:
+            cursor = get_db().cursor()
+            cursor.execute(query)  # VULNERABLE!
+            user = cursor.fetchone()
+            cursor.close()
+
+        if user:
+            # Successful login
+            user_dict = dict(user)
+            secret = user_dict.get('secret', 'No secret for this user')
+
+            return _OK_TMPL.format_map({
+                'username': _escape(user_dict['username']),
+                'role': _escape(user_dict['role']),
+                'secret': _escape(secret),
+            })
+        else:
+            # Failed login
+            return _FAIL_HTML
+
+    except sqlite3.Error as e:
+        # SQL error (useful for exploitation!)
+        return _ERR_TMPL.format_map({
+            'error': _escape(e),
+            'query': _escape(query),
+        })
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)
@@ -10,6 +10,12 @@ import os
 conn = sqlite3.connect('users.db')
 cursor = conn.cursor()
 
+# Bulk-load in one transaction without journaling or fsyncs; a failed
+# build just reruns this script
+cursor.execute('PRAGMA journal_mode=MEMORY')
+cursor.execute('PRAGMA synchronous=OFF')
+cursor.execute('BEGIN')
+
 # Create users table
 cursor.execute('''
     CREATE TABLE users (
@@ -21,6 +27,9 @@ cursor.execute('''
     )
 ''')
 
+# Login looks users up by name
+cursor.execute('CREATE INDEX idx_users_username ON users(username)')
+
 # Get flag from environment or use default
 FLAG = os.environ.get('FLAG', 'ARENA{SQL_1nj3ct10n_m4st3r}')
 
@@ -6,7 +6,12 @@ INTENTIONALLY VULNERABLE FOR EDUCATIONAL PURPOSES
 DO NOT USE IN PRODUCTION
 """
 
-from flask import Flask, request, make_response, redirect
+from flask import Flask, Response, request, make_response, redirect
+from markupsafe import escape as _escape
+from collections import Counter, defaultdict
+from functools import lru_cache
+import threading
+import gzip
 import os
 
 app = Flask(__name__)
@@ -21,25 +26,19 @@ users = {
     'attacker': {'balance': 0, 'password': 'evil'}
 }
 
-# Track transfers
+# Track transfers, plus running totals per recipient and each sender's
+# history so page loads don't rescan the whole list
 transfers = []
+credited_to = Counter()
+by_sender = defaultdict(list)
 
-@app.route('/')
-def index():
-    """Home page with login"""
-    session_user = request.cookies.get('session_user')
-
-    if session_user and session_user in users:
-        # User is logged in
-        user_data = users[session_user]
-        balance = user_data['balance']
-
-        # Show flag if money was transferred to attacker
-        flag_message = ""
-        if any(t['to'] == 'attacker' and t['amount'] > 0 for t in transfers):
-            flag_message = f'<div class="flag">🚩 Flag: {FLAG}</div>'
+# Transfers are handled on several threads; serialize the balance
+# check and the account/history updates
+_transfer_lock = threading.Lock()
 
-        html = f"""
+# Page bodies, built once; the account page only fills in its fields
+# and streams the transfer history between its head and tail
+_HOME_TMPL = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -112,7 +111,7 @@ def index():
         <body>
             <div class="header">
                 <h1>🏦 SecureBank</h1>
-                <p>Welcome, {session_user}! | <a href="/logout" style="color: white;">Logout</a></p>
+                <p>Welcome, {user}! | <a href="/logout" style="color: white;">Logout</a></p>
             </div>
 
             {flag_message}
@@ -132,15 +131,21 @@ def index():
 
             <div class="history">
                 <h2>Transfer History</h2>
-                {"".join(f'<div class="transfer-item">Transferred ${t["amount"]} to {t["to"]}</div>' for t in transfers if t["from"] == session_user)}
+                {history}
             </div>
         </body>
         </html>
         """
-        return html
-    else:
-        # Show login form
-        html = """
+
+_HOME_HEAD, _HOME_TAIL = _HOME_TMPL.split('{history}')
+_HOME_TAIL = _HOME_TAIL.encode('utf-8')
+
+_HISTORY_ITEM = b'<div class="transfer-item">Transferred $%d to %s</div>'
+
+# History entries are batched into chunks of about this many bytes
+_CHUNK_SIZE = 16384
+
+_LOGIN_HTML = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -204,8 +209,62 @@ def index():
             </div>
         </body>
         </html>
-        """
-        return html
+        """.encode('utf-8')
+_LOGIN_GZ = gzip.compress(_LOGIN_HTML, compresslevel=9)
+
+def _html_page(body, body_gz):
+    """Serve a prebuilt page, gzip-encoded when the client accepts it"""
+    if request.accept_encodings['gzip']:
+        response = Response(body_gz, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(body, mimetype='text/html')
+    response.vary.add('Accept-Encoding')
+    return response
+
+@lru_cache(maxsize=64)
+def _render_head(user, balance, flag_on):
+    """Render the account page up to the transfer history"""
+    # Show flag if money was transferred to attacker
+    flag_message = ""
+    if flag_on:
+        flag_message = f'<div class="flag">🚩 Flag: {FLAG}</div>'
+
+    return _HOME_HEAD.format_map({
+        'user': _escape(user),
+        'flag_message': flag_message,
+        'balance': balance,
+    }).encode('utf-8')
+
+@app.route('/')
+def index():
+    """Home page with login"""
+    session_user = request.cookies.get('session_user')
+
+    if session_user and session_user in users:
+        # User is logged in
+        # Everything that changes the head is part of the cache key, so
+        # repeated refreshes of an unchanged account reuse its bytes
+        head = _render_head(session_user, users[session_user]['balance'], credited_to['attacker'] > 0)
+        history = by_sender.get(session_user, ())
+
+        def body():
+            # Collect entries in a bytearray and send them in batches rather
+            # than as one write per entry or one big joined string
+            yield head
+            buf = bytearray()
+            for t in history:
+                buf += _HISTORY_ITEM % (t['amount'], _escape(t['to']).encode('utf-8'))
+                if len(buf) >= _CHUNK_SIZE:
+                    yield bytes(buf)
+                    buf.clear()
+            buf += _HOME_TAIL
+            yield bytes(buf)
+
+        return Response(body(), mimetype='text/html')
+    else:
+        # Show login form
+        return _html_page(_LOGIN_HTML, _LOGIN_GZ)
 
 @app.route('/login', methods=['POST'])
 def login():
@@ -235,31 +294,42 @@ def transfer():
     """
     session_user = request.cookies.get('session_user')
 
-    if not session_user or session_user not in users:
-        return "Not logged in. <a href='/'>Login</a>"
+    # Look each account up once and work on the records directly
+    src = users.get(session_user) if session_user else None
+    if src is None:
+        return "Not logged in. <a href='/'>Login</a>", 401
 
-    to_user = request.form.get('to', '')
-    amount = int(request.form.get('amount', 0))
+    form = request.form
+    to_user = form.get('to', '')
+    try:
+        amount = int(form['amount'])
+    except (KeyError, ValueError):
+        return "Invalid amount. <a href='/'>Go back</a>", 400
 
-    if to_user not in users:
-        return f"User '{to_user}' not found. <a href='/'>Go back</a>"
+    dst = users.get(to_user)
+    if dst is None:
+        return f"User '{_escape(to_user)}' not found. <a href='/'>Go back</a>", 404
 
     if amount <= 0:
-        return "Invalid amount. <a href='/'>Go back</a>"
+        return "Invalid amount. <a href='/'>Go back</a>", 400
 
-    if users[session_user]['balance'] < amount:
-        return "Insufficient funds. <a href='/'>Go back</a>"
+    with _transfer_lock:
+        if src['balance'] < amount:
+            return "Insufficient funds. <a href='/'>Go back</a>", 400
 
-    # Perform transfer (VULNERABLE: No CSRF token check!)
-    users[session_user]['balance'] -= amount
-    users[to_user]['balance'] += amount
+        # Perform transfer (VULNERABLE: No CSRF token check!)
+        src['balance'] -= amount
+        dst['balance'] += amount
 
-    # Record transfer
-    transfers.append({
-        'from': session_user,
-        'to': to_user,
-        'amount': amount
-    })
+        # Record transfer
+        record = {
+            'from': session_user,
+            'to': to_user,
+            'amount': amount
+        }
+        transfers.append(record)
+        credited_to[to_user] += amount
+        by_sender[session_user].append(record)
 
     return redirect('/')
 
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Cached YAML loading shared by the game engine and the visualization server.
+
+Mission files are re-read several times per level (briefing, hints, play
+loop, and the visualizer's hints endpoint); only the first read of an
+unchanged file parses it.
+"""
+
+from pathlib import Path
+
+import yaml
+
+# libyaml's C loader is much faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Parsed YAML files: path -> ((mtime_ns, size), data)
+_yaml_cache = {}
+
+
+def load_yaml_cached(path: Path):
+    """
+    Load a YAML file, reusing the previous parse while the file is unchanged.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML data (shared between callers; do not modify)
+    """
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _yaml_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with open(path, 'r') as f:
+        data = yaml.load(f, Loader=YamlLoader)
+    _yaml_cache[path] = (key, data)
+    return data
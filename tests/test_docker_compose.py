@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared Docker Compose helpers and the web security deployer's
+container status queries.
+
+The docker CLI is replaced by small shell scripts on PATH and the Docker
+SDK by a fake client, so no daemon is needed.
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from domains._base import docker_compose
+from domains.web_security.deployer import DockerComposeDeployer
+
+
+# One `docker ps --format "{{json .}}"` line for a healthy web container
+PS_LINE = (
+    '{"Names":"arena_web_w_l-web-1","State":"running",'
+    '"Status":"Up 5 seconds (healthy)",'
+    '"Ports":"0.0.0.0:8081->5000/tcp, :::8081->5000/tcp",'
+    '"Labels":"com.docker.compose.project=arena_web_w_l,com.docker.compose.service=web"}'
+)
+
+
+def fake_docker(tmp_path, monkeypatch, script):
+    """Put a fake `docker` executable running script first on PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    docker = bin_dir / "docker"
+    docker.write_text("#!/bin/sh\n" + textwrap.dedent(script))
+    docker.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+
+def level_dir(tmp_path):
+    """Create a level directory with an (empty) docker-compose.yml."""
+    level = tmp_path / "world-1" / "level-01"
+    level.mkdir(parents=True)
+    (level / "docker-compose.yml").write_text("services: {}\n")
+    return level
+
+
+class FakeContainer:
+    """Minimal stand-in for a docker SDK Container."""
+
+    def __init__(self, name, status, health=None, ports=None, service="web"):
+        self.name = name
+        self.status = status
+        self.attrs = {'State': {'Status': status}}
+        if health:
+            self.attrs['State']['Health'] = {'Status': health}
+        self.ports = ports or {}
+        self.labels = {'com.docker.compose.service': service}
+
+
+class FakeClient:
+    """Minimal stand-in for a docker SDK client."""
+
+    def __init__(self, containers):
+        self.containers = self
+        self._containers = containers
+        self.filters = None
+
+    def list(self, all=False, filters=None):
+        self.filters = filters
+        return self._containers
+
+
+def test_read_json_lines_times_out_and_kills_process():
+    """A command that outlives its deadline is killed and TimeoutExpired raised"""
+    with pytest.raises(subprocess.TimeoutExpired):
+        docker_compose._read_json_lines(["sh", "-c", "sleep 5"], timeout=0.2)
+
+
+def test_read_json_lines_skips_blank_and_malformed_lines():
+    """Only lines that decode as JSON are returned, including an unterminated last line"""
+    cmd = ["sh", "-c", "printf '\\n{\"a\": 1}\\nnot json\\n   \\n{\"b\": 2}'"]
+    assert docker_compose._read_json_lines(cmd, timeout=5) == [{"a": 1}, {"b": 2}]
+
+
+def test_read_json_lines_returns_none_on_failure():
+    """A non-zero exit status returns None"""
+    cmd = ["sh", "-c", "echo '{\"a\": 1}'; exit 1"]
+    assert docker_compose._read_json_lines(cmd, timeout=5) is None
+
+
+def test_parse_line():
+    """Blank and invalid lines decode to None"""
+    assert docker_compose._parse_line(b"") is None
+    assert docker_compose._parse_line(b"  \t") is None
+    assert docker_compose._parse_line(b"{oops") is None
+    assert docker_compose._parse_line(b'{"State": "running"}') == {"State": "running"}
+
+
+def test_query_project_containers_maps_docker_ps_output(tmp_path, monkeypatch):
+    """docker ps JSON lines are converted to the `docker compose ps` shape"""
+    fake_docker(tmp_path, monkeypatch, f"""
+        echo ''
+        echo 'garbage'
+        echo '{PS_LINE}'
+    """)
+
+    assert docker_compose.query_project_containers("arena_web_w_l") == [{
+        'Name': 'arena_web_w_l-web-1',
+        'Service': 'web',
+        'State': 'running',
+        'Health': 'healthy',
+        'Publishers': [{'TargetPort': 5000, 'PublishedPort': 8081}],
+    }]
+
+
+def test_docker_ps_info_defaults():
+    """Missing labels, status and ports fall back to the compose defaults"""
+    assert docker_compose._docker_ps_info({'Names': 'a,b', 'State': 'exited'}) == {
+        'Name': 'a',
+        'Service': 'unknown',
+        'State': 'exited',
+        'Health': '',
+        'Publishers': [],
+    }
+
+
+def test_container_ps_info_matches_cli_shape():
+    """SDK containers are converted to the same shape as the CLI output"""
+    container = FakeContainer(
+        "arena_web_w_l-web-1", "running", health="healthy",
+        ports={
+            '5000/tcp': [{'HostIp': '0.0.0.0', 'HostPort': '8081'},
+                         {'HostIp': '::', 'HostPort': '8081'}],
+            '22/tcp': None,
+        }
+    )
+
+    assert docker_compose.container_ps_info(container) == {
+        'Name': 'arena_web_w_l-web-1',
+        'Service': 'web',
+        'State': 'running',
+        'Health': 'healthy',
+        'Publishers': [{'TargetPort': 5000, 'PublishedPort': 8081}],
+    }
+
+
+def test_get_status_uses_sdk_client(tmp_path, monkeypatch):
+    """With a Docker SDK client, status comes from the Engine API"""
+    # Any CLI call would fail the test
+    fake_docker(tmp_path, monkeypatch, "exit 99\n")
+    level = level_dir(tmp_path)
+    client = FakeClient([FakeContainer("web-1", "running"), FakeContainer("db-1", "running")])
+    deployer = DockerComposeDeployer({'id': 'web_security'})
+    monkeypatch.setattr(deployer, "_get_client", lambda: client)
+
+    status = deployer.get_status(level)
+
+    assert status['ready'] is True
+    assert [c['name'] for c in status['containers']] == ["web-1", "db-1"]
+    assert client.filters == {
+        "label": f"com.docker.compose.project={deployer._get_project_name(level)}"
+    }
+
+
+def test_get_status_falls_back_to_cli(tmp_path, monkeypatch):
+    """Without the SDK, status comes from docker ps"""
+    fake_docker(tmp_path, monkeypatch, f"echo '{PS_LINE}'\n")
+    level = level_dir(tmp_path)
+    deployer = DockerComposeDeployer({'id': 'web_security'})
+    monkeypatch.setattr(deployer, "_get_client", lambda: None)
+
+    status = deployer.get_status(level)
+
+    assert status == {
+        'ready': True,
+        'message': 'All containers running',
+        'containers': [{'name': 'arena_web_w_l-web-1', 'status': 'running', 'health': 'healthy'}],
+    }
+
+
+def test_get_status_reports_cli_failure(tmp_path, monkeypatch):
+    """A failing docker ps is reported as not ready"""
+    fake_docker(tmp_path, monkeypatch, "exit 1\n")
+    level = level_dir(tmp_path)
+    deployer = DockerComposeDeployer({'id': 'web_security'})
+    monkeypatch.setattr(deployer, "_get_client", lambda: None)
+
+    status = deployer.get_status(level)
+
+    assert status['ready'] is False
+    assert status['message'] == 'Failed to get container status'
+
+
+def test_get_status_reports_cli_timeout(tmp_path, monkeypatch):
+    """A docker ps that times out is reported as not ready, with no containers"""
+    def slow_docker_ps(cmd, timeout):
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+    monkeypatch.setattr(docker_compose, "_read_json_lines", slow_docker_ps)
+    level = level_dir(tmp_path)
+    deployer = DockerComposeDeployer({'id': 'web_security'})
+    monkeypatch.setattr(deployer, "_get_client", lambda: None)
+
+    status = deployer.get_status(level)
+
+    assert status == {'ready': False, 'message': 'Timeout checking status', 'containers': []}
+
+
+def test_deploy_retries_without_wait_only_when_unsupported(tmp_path, monkeypatch):
+    """Compose releases without --wait start detached and are polled"""
+    log = tmp_path / "calls.log"
+    fake_docker(tmp_path, monkeypatch, f"""
+        echo "$*" >> {log}
+        case "$*" in
+            *--help*) echo "Usage: docker compose up [OPTIONS]" ;;
+        esac
+    """)
+    level = level_dir(tmp_path)
+    deployer = DockerComposeDeployer({'id': 'web_security'})
+    monkeypatch.setattr(deployer, "_project_has_containers", lambda name: False)
+    monkeypatch.setattr(deployer, "_wait_until_ready", lambda path, name: {'ready': True})
+
+    assert deployer.deploy_challenge(level)[0] is True
+    assert deployer.deploy_challenge(level)[0] is True
+
+    calls = log.read_text().splitlines()
+    assert calls.count("compose up --help") == 1
+    assert not any("--wait" in call for call in calls)
+
+
+def test_deploy_reports_wait_failure(tmp_path, monkeypatch):
+    """A failing `up --wait` is reported, not retried without --wait"""
+    log = tmp_path / "calls.log"
+    fake_docker(tmp_path, monkeypatch, f"""
+        echo "$*" >> {log}
+        case "$*" in
+            *--help*) echo "      --wait    Wait for services to be running|healthy" ;;
+            *--wait*) echo "container web-1 is unhealthy (--wait)" >&2; exit 1 ;;
+        esac
+    """)
+    level = level_dir(tmp_path)
+    deployer = DockerComposeDeployer({'id': 'web_security'})
+    monkeypatch.setattr(deployer, "_project_has_containers", lambda name: False)
+
+    success, message = deployer.deploy_challenge(level)
+
+    assert success is False
+    assert "unhealthy" in message
+    up_calls = [c for c in log.read_text().splitlines() if " up " in c and "--help" not in c]
+    assert len(up_calls) == 1
+
+
+def test_get_status_falls_back_to_cli_when_sdk_fails(tmp_path, monkeypatch):
+    """An SDK client that can't reach the daemon falls back to docker ps"""
+    class UnreachableClient(FakeClient):
+        def list(self, all=False, filters=None):
+            raise ConnectionError("Error while fetching server API version")
+
+    fake_docker(tmp_path, monkeypatch, f"echo '{PS_LINE}'\n")
+    level = level_dir(tmp_path)
+    deployer = DockerComposeDeployer({'id': 'web_security'})
+    monkeypatch.setattr(deployer, "_get_client", lambda: UnreachableClient([]))
+
+    status = deployer.get_status(level)
+
+    assert status['ready'] is True
+    assert [c['name'] for c in status['containers']] == ['arena_web_w_l-web-1']
+
+
+def test_get_docker_client_is_none_when_ping_fails(monkeypatch):
+    """A client whose daemon doesn't answer a ping is not used"""
+    class DeadClient:
+        def ping(self):
+            raise ConnectionError("socket not found")
+
+    monkeypatch.setitem(sys.modules, "docker", SimpleNamespace(from_env=DeadClient))
+    monkeypatch.setattr(docker_compose, "_client", None)
+    monkeypatch.setattr(docker_compose, "_client_checked", False)
+
+    assert docker_compose.get_docker_client() is None
+    assert docker_compose._client_checked is True
+
+
+def test_wait_until_ready_does_not_grow_warm_up(tmp_path, monkeypatch):
+    """Repeated deploys don't inflate the recorded startup time"""
+    clock = [0.0]
+    monkeypatch.setattr("domains.web_security.deployer.time.monotonic", lambda: clock[0])
+
+    def sleep(seconds):
+        clock[0] += seconds
+
+    monkeypatch.setattr("domains.web_security.deployer.time.sleep", sleep)
+    level = level_dir(tmp_path)
+    deployer = DockerComposeDeployer({'id': 'web_security'})
+
+    def get_status(path):
+        # Each poll costs 10ms; containers are up 300ms after the start
+        clock[0] += 0.01
+        return {'ready': clock[0] >= 0.3}
+
+    monkeypatch.setattr(deployer, "get_status", get_status)
+
+    for _ in range(5):
+        clock[0] = 0.0
+        deployer._wait_until_ready(level, "proj")
+
+    assert deployer._last_ready_ms["proj"] <= 400
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for domain plugin discovery
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine import engine
+
+
+@pytest.fixture
+def loaded(tmp_path, monkeypatch):
+    """
+    Lay out a domains/ tree and record which domain directories get loaded.
+
+    Returns the list of loaded directory names; the base directory is
+    tmp_path.
+    """
+    for name in ("api_security", "web_security", "_base"):
+        (tmp_path / "domains" / name).mkdir(parents=True)
+
+    loaded = []
+
+    def load_domain(domain_path):
+        loaded.append(domain_path.name)
+        if not domain_path.is_dir():
+            return None
+        return SimpleNamespace(config=SimpleNamespace(id=domain_path.name))
+
+    monkeypatch.setattr(engine, "_domains_cache", {})
+    monkeypatch.setattr(engine, "_load_domain", load_domain)
+    return loaded
+
+
+def test_preselected_domain_loads_only_that_domain(tmp_path, loaded):
+    """A preselected domain is imported on its own"""
+    domains = engine.discover_domains(tmp_path, domain_id="web_security")
+
+    assert list(domains) == ["web_security"]
+    assert loaded == ["web_security"]
+
+
+def test_discovery_is_cached(tmp_path, loaded):
+    """A second discovery returns the cached domains without reloading"""
+    first = engine.discover_domains(tmp_path, domain_id="web_security")
+    second = engine.discover_domains(tmp_path, domain_id="web_security")
+
+    assert second is first
+    assert loaded == ["web_security"]
+
+
+def test_full_scan_skips_private_directories(tmp_path, loaded):
+    """Without a preselected domain every domain but _base is loaded, in name order"""
+    domains = engine.discover_domains(tmp_path)
+
+    assert list(domains) == ["api_security", "web_security"]
+    assert loaded == ["api_security", "web_security"]
+
+
+def test_preselected_domain_reuses_full_scan(tmp_path, loaded):
+    """A domain already loaded by a full scan is not imported again"""
+    scanned = engine.discover_domains(tmp_path)
+    domains = engine.discover_domains(tmp_path, domain_id="api_security")
+
+    assert domains == {"api_security": scanned["api_security"]}
+    assert loaded == ["api_security", "web_security"]
+
+
+def test_unknown_preselected_domain_falls_back_to_full_scan(tmp_path, loaded):
+    """A preselected id with no directory of its own triggers a full scan"""
+    domains = engine.discover_domains(tmp_path, domain_id="missing")
+
+    assert list(domains) == ["api_security", "web_security"]
+    assert loaded == ["missing", "api_security", "web_security"]
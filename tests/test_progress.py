@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for saving player progress
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from engine import engine
+
+
+def make_arena(progress_file):
+    """Create an Arena with only the state save_progress needs."""
+    arena = engine.Arena.__new__(engine.Arena)
+    arena.progress_file = progress_file
+    arena.progress = {
+        "player_name": "Padawan",
+        "domains": {"web_security": {"total_xp": 0, "completed_levels": []}}
+    }
+    arena._saved_progress = None
+    return arena
+
+
+def count_replaces(monkeypatch):
+    """Count os.replace calls made by save_progress."""
+    calls = []
+    real_replace = os.replace
+
+    def replace(src, dst):
+        calls.append((src, dst))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(engine.os, "replace", replace)
+    return calls
+
+
+def test_save_progress_skips_unchanged_progress(tmp_path, monkeypatch):
+    """Saving the same progress twice writes the file once"""
+    progress_file = tmp_path / "progress.json"
+    arena = make_arena(progress_file)
+    calls = count_replaces(monkeypatch)
+
+    arena.save_progress()
+    arena.save_progress()
+    assert len(calls) == 1
+    assert json.loads(progress_file.read_text()) == arena.progress
+
+    arena.progress["domains"]["web_security"]["total_xp"] = 100
+    arena.save_progress()
+    assert len(calls) == 2
+    assert json.loads(progress_file.read_text())["domains"]["web_security"]["total_xp"] == 100
+
+
+def test_save_progress_writes_through_temp_file(tmp_path, monkeypatch):
+    """The new progress replaces progress.json from a temporary file"""
+    progress_file = tmp_path / "progress.json"
+    arena = make_arena(progress_file)
+    calls = count_replaces(monkeypatch)
+
+    arena.save_progress()
+
+    assert calls == [(progress_file.with_suffix(".json.tmp"), progress_file)]
+    assert not progress_file.with_suffix(".json.tmp").exists()
+
+
+def test_failed_save_keeps_previous_progress(tmp_path, monkeypatch):
+    """A write that fails before the replace leaves progress.json intact"""
+    progress_file = tmp_path / "progress.json"
+    arena = make_arena(progress_file)
+    arena.save_progress()
+    before = progress_file.read_bytes()
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(engine.os, "replace", fail_replace)
+    arena.progress["domains"]["web_security"]["total_xp"] = 100
+    with pytest.raises(OSError):
+        arena.save_progress()
+
+    assert progress_file.read_bytes() == before
+
+    # The failed save is retried by the next one
+    monkeypatch.undo()
+    arena.save_progress()
+    assert json.loads(progress_file.read_text())["domains"]["web_security"]["total_xp"] == 100
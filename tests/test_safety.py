@@ -86,3 +86,39 @@ def test_safety_guards():
 if __name__ == "__main__":
     exit_code = test_safety_guards()
     sys.exit(exit_code)
+
+
+def test_compose_scan_reports_overlapping_patterns(tmp_path):
+    """Patterns matching the same text are all reported"""
+    from domains._base.safety_guard import SafetyPattern, SafetySeverity
+    from domains.web_security.safety_guard import WebSecuritySafetyGuard
+
+    class OverlappingGuard(WebSecuritySafetyGuard):
+        def get_dangerous_patterns(self):
+            return super().get_dangerous_patterns() + [
+                SafetyPattern(
+                    pattern=r"/var/run/docker\.sock",
+                    message="Docker socket referenced",
+                    severity=SafetySeverity.CRITICAL,
+                ),
+            ]
+
+    (tmp_path / "docker-compose.yml").write_text(
+        "services:\n"
+        "  web:\n"
+        "    privileged: true\n"
+        "    volumes:\n"
+        "      - /var/run/docker.sock:/tmp/docker.sock\n"
+    )
+    guard = OverlappingGuard({'id': 'web_security'})
+
+    messages = [p.message for i, (_, p) in enumerate(guard._patterns)
+                if i in guard._scan_compose_file(tmp_path / "docker-compose.yml")]
+
+    assert "Mounting Docker socket gives container full Docker access" in messages
+    assert "Docker socket referenced" in messages
+    assert "Running containers in privileged mode grants excessive permissions" in messages
+
+    safe, message = guard.pre_deploy_check(tmp_path)
+    assert safe is False
+    assert "Docker socket referenced" in message
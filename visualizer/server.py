@@ -7,15 +7,53 @@ Provides real-time cluster state visualization with architecture diagrams
 import json
 import subprocess
 import threading
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+import time
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 import os
-
+import sys
+
+# Mission YAML cache, shared with the engine. The engine run as a script
+# finds it by its bare name; otherwise it comes from the engine package
+try:
+    from yaml_cache import load_yaml_cached
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from engine.yaml_cache import load_yaml_cached
+
+# orjson is optional: it encodes API responses faster
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Constant responses, encoded once
+_NO_LEVEL_HINTS = _json_dumps({'hints': [], 'message': 'No level loaded'})
+_NO_LEVEL_SOLUTION = _json_dumps({'solution': '', 'message': 'No level loaded'})
+_NO_LEVEL_DEBRIEF = _json_dumps({'debrief': '', 'message': 'No level loaded'})
+_ERR_NO_FLAG = _json_dumps({'success': False, 'message': 'No flag provided'})
+_ERR_NO_HINT_NUMBER = _json_dumps({'success': False, 'message': 'No hint number provided'})
+_ERR_NO_LEVEL = _json_dumps({'success': False, 'message': 'No level loaded. Start a challenge first!'})
+_ERR_NO_VALIDATOR = _json_dumps({'success': False, 'message': 'Validator not available'})
+_ERR_NO_UNLOCK = _json_dumps({'success': False, 'message': 'Unlock callback not available'})
 
 class DevSecOpsArenaVisualizerHandler(SimpleHTTPRequestHandler):
     """HTTP handler for DevSecOps Arena visualization server"""
 
+    # Seconds an encoded /api/state response is reused for; absorbs
+    # polling from several open tabs without re-querying the environment
+    STATE_TTL = 1.0
+
+    # Keep connections open between the frontend's polls; every response
+    # carries a Content-Length. Idle connections are dropped after timeout.
+    protocol_version = 'HTTP/1.1'
+    timeout = 60
+
     def __init__(self, *args, game_state_callback=None, domain_visualizer=None, current_level_path=None, validator_callback=None, unlock_hint_callback=None, **kwargs):
         self.game_state_callback = game_state_callback
         self.domain_visualizer = domain_visualizer
@@ -54,8 +92,41 @@ class DevSecOpsArenaVisualizerHandler(SimpleHTTPRequestHandler):
         else:
             self.send_error(404, "Not Found")
 
+    def _get_level_path(self):
+        """Get the current level path from the engine, or None"""
+        if callable(self.current_level_path):
+            return self.current_level_path()
+        return None
+
+    def _read_json(self):
+        """Read the request body as a JSON object, or None if it isn't one"""
+        content_length = int(self.headers.get('Content-Length', 0))
+        try:
+            data = json.loads(self.rfile.read(content_length))
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _send_json(self, status, payload):
+        """Send a JSON response"""
+        self._send_json_body(status, _json_dumps(payload))
+
+    def _send_json_body(self, status, body):
+        """Send an already encoded JSON response"""
+        self.send_response(status)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def serve_cluster_state(self):
         """Serve current environment state and game progress"""
+        cached = self.server.state_cache
+        if cached is not None and time.monotonic() - cached[0] < self.STATE_TTL:
+            self._send_json_body(200, cached[1])
+            return
+
         try:
             # Get game state from callback
             game_state = {}
@@ -66,7 +137,7 @@ class DevSecOpsArenaVisualizerHandler(SimpleHTTPRequestHandler):
             env_state = {}
             if self.domain_visualizer:
                 # Use domain visualizer to get state
-                level_path = self.current_level_path() if self.current_level_path and callable(self.current_level_path) else None
+                level_path = self._get_level_path()
                 viz_data = self.domain_visualizer.get_visualization_data(level_path)
                 # Extract resources for backward compatibility with frontend
                 env_state = viz_data.get('resources', {})
@@ -82,14 +153,12 @@ class DevSecOpsArenaVisualizerHandler(SimpleHTTPRequestHandler):
             response = {
                 'game': game_state,
                 'cluster': env_state,  # Keep 'cluster' key for backward compatibility
-                'timestamp': subprocess.check_output(['date', '+%s']).decode().strip()
+                'timestamp': str(int(time.time()))
             }
 
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            body = _json_dumps(response)
+            self.server.state_cache = (time.monotonic(), body)
+            self._send_json_body(200, body)
 
         except Exception as e:
             self.send_error(500, f"Error getting environment state: {str(e)}")
@@ -176,11 +245,7 @@ class DevSecOpsArenaVisualizerHandler(SimpleHTTPRequestHandler):
                 except:
                     diagram_data = self._get_generic_diagram(current_domain)
 
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(diagram_data).encode())
+            self._send_json(200, diagram_data)
 
         except Exception as e:
             self.send_error(500, f"Error getting diagram: {str(e)}")
@@ -354,16 +419,10 @@ class DevSecOpsArenaVisualizerHandler(SimpleHTTPRequestHandler):
     def serve_hints(self):
         """Serve hints for current level with lock status and costs"""
         try:
-            level_path = None
-            if self.current_level_path and callable(self.current_level_path):
-                level_path = self.current_level_path()
+            level_path = self._get_level_path()
 
             if not level_path:
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({'hints': [], 'message': 'No level loaded'}).encode())
+                self._send_json_body(200, _NO_LEVEL_HINTS)
                 return
 
             # Get game state to check unlocked hints
@@ -376,13 +435,10 @@ class DevSecOpsArenaVisualizerHandler(SimpleHTTPRequestHandler):
             level_unlocked = unlocked_hints.get(level_name, [])
 
             # Read mission.yaml to get hint costs
-            import yaml
             mission_file = level_path / "mission.yaml"
             hint_costs = {}
             if mission_file.exists():
-                with open(mission_file, 'r') as f:
-                    mission_data = yaml.safe_load(f)
-                    hint_costs = mission_data.get('hints_cost', {})
+                hint_costs = (load_yaml_cached(mission_file) or {}).get('hints_cost', {})
 
             # Read hint files with lock status
             hints = []
@@ -407,14 +463,10 @@ class DevSecOpsArenaVisualizerHandler(SimpleHTTPRequestHandler):
 
                     hints.append(hint_data)
 
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps({
+            self._send_json(200, {
                 'hints': hints,
                 'current_xp': game_state.get('total_xp', 0)
-            }).encode())
+            })
 
         except Exception as e:
             self.send_error(500, f"Error getting hints: {str(e)}")
@@ -422,16 +474,10 @@ class DevSecOpsArenaVisualizerHandler(SimpleHTTPRequestHandler):
     def serve_solution(self):
         """Serve solution for current level"""
         try:
-            level_path = None
-            if self.current_level_path and callable(self.current_level_path):
-                level_path = self.current_level_path()
+            level_path = self._get_level_path()
 
             if not level_path:
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({'solution': '', 'message': 'No level loaded'}).encode())
+                self._send_json_body(200, _NO_LEVEL_SOLUTION)
                 return
 
             # Try to read solution file (could be .yaml, .md, .txt in root or solution/ dir)
@@ -470,14 +516,10 @@ class DevSecOpsArenaVisualizerHandler(SimpleHTTPRequestHandler):
                         except:
                             pass
 
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps({
+            self._send_json(200, {
                 'solution': solution_content,
                 'type': solution_type
-            }).encode())
+            })
 
         except Exception as e:
             self.send_error(500, f"Error getting solution: {str(e)}")
@@ -485,16 +527,10 @@ class DevSecOpsArenaVisualizerHandler(SimpleHTTPRequestHandler):
     def serve_debrief(self):
         """Serve debrief/learning content for current level"""
         try:
-            level_path = None
-            if self.current_level_path and callable(self.current_level_path):
-                level_path = self.current_level_path()
+            level_path = self._get_level_path()
 
             if not level_path:
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({'debrief': '', 'message': 'No level loaded'}).encode())
+                self._send_json_body(200, _NO_LEVEL_DEBRIEF)
                 return
 
             # Read debrief file
@@ -505,14 +541,10 @@ class DevSecOpsArenaVisualizerHandler(SimpleHTTPRequestHandler):
                 with open(debrief_file, 'r') as f:
                     debrief_content = f.read()
 
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps({
+            self._send_json(200, {
                 'debrief': debrief_content,
                 'type': 'markdown'
-            }).encode())
+            })
 
         except Exception as e:
             self.send_error(500, f"Error getting debrief: {str(e)}")
@@ -520,120 +552,70 @@ class DevSecOpsArenaVisualizerHandler(SimpleHTTPRequestHandler):
     def handle_flag_submission(self):
         """Handle flag submission from visualizer"""
         try:
-            # Read request body
-            content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length).decode('utf-8')
-            data = json.loads(body)
+            data = self._read_json()
+            if data is None:
+                self.send_error(400, "Invalid JSON")
+                return
 
             flag = data.get('flag', '').strip()
 
             if not flag:
-                self.send_response(400)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({
-                    'success': False,
-                    'message': 'No flag provided'
-                }).encode())
+                self._send_json_body(400, _ERR_NO_FLAG)
                 return
 
-            # Get current level path
-            level_path = None
-            if self.current_level_path and callable(self.current_level_path):
-                level_path = self.current_level_path()
+            level_path = self._get_level_path()
 
             if not level_path:
-                self.send_response(400)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({
-                    'success': False,
-                    'message': 'No level loaded. Start a challenge first!'
-                }).encode())
+                self._send_json_body(400, _ERR_NO_LEVEL)
                 return
 
             # Validate flag using validator callback
             if not self.validator_callback or not callable(self.validator_callback):
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({
-                    'success': False,
-                    'message': 'Validator not available'
-                }).encode())
+                self._send_json_body(500, _ERR_NO_VALIDATOR)
                 return
 
             # Call validator with flag
             success, message = self.validator_callback(level_path, flag)
+            if success:
+                self.server.state_cache = None
 
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps({
+            self._send_json(200, {
                 'success': success,
                 'message': message
-            }).encode())
+            })
 
-        except json.JSONDecodeError:
-            self.send_error(400, "Invalid JSON")
         except Exception as e:
             self.send_error(500, f"Error validating flag: {str(e)}")
 
     def handle_hint_unlock(self):
         """Handle hint unlock request from visualizer"""
         try:
-            # Read request body
-            content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length).decode('utf-8')
-            data = json.loads(body)
+            data = self._read_json()
+            if data is None:
+                self.send_error(400, "Invalid JSON")
+                return
 
             hint_number = data.get('hint_number')
 
             if not hint_number:
-                self.send_response(400)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({
-                    'success': False,
-                    'message': 'No hint number provided'
-                }).encode())
+                self._send_json_body(400, _ERR_NO_HINT_NUMBER)
                 return
 
-            # Get current level path
-            level_path = None
-            if self.current_level_path and callable(self.current_level_path):
-                level_path = self.current_level_path()
+            level_path = self._get_level_path()
 
             if not level_path:
-                self.send_response(400)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({
-                    'success': False,
-                    'message': 'No level loaded. Start a challenge first!'
-                }).encode())
+                self._send_json_body(400, _ERR_NO_LEVEL)
                 return
 
             # Unlock hint using callback
             if not self.unlock_hint_callback or not callable(self.unlock_hint_callback):
-                self.send_response(500)
-                self.send_header('Content-type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({
-                    'success': False,
-                    'message': 'Unlock callback not available'
-                }).encode())
+                self._send_json_body(500, _ERR_NO_UNLOCK)
                 return
 
             # Call unlock callback
             success, message, cost = self.unlock_hint_callback(level_path, hint_number)
+            if success:
+                self.server.state_cache = None
 
             # Read hint content if successful
             hint_content = None
@@ -643,19 +625,13 @@ class DevSecOpsArenaVisualizerHandler(SimpleHTTPRequestHandler):
                     with open(hint_file, 'r') as f:
                         hint_content = f.read().strip()
 
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps({
+            self._send_json(200, {
                 'success': success,
                 'message': message,
                 'hint_content': hint_content,
                 'cost': cost
-            }).encode())
+            })
 
-        except json.JSONDecodeError:
-            self.send_error(400, "Invalid JSON")
         except Exception as e:
             self.send_error(500, f"Error unlocking hint: {str(e)}")
 
@@ -757,8 +733,12 @@ class VisualizationServer:
                 **kwargs
             )
 
-        self.server = HTTPServer(('localhost', self.port), handler)
+        # One thread per connection, so a slow environment query for one
+        # poll doesn't hold up static files or other API calls
+        self.server = ThreadingHTTPServer(('localhost', self.port), handler)
         self.server.verbose = self.verbose
+        # (monotonic time, encoded body) of the last /api/state response
+        self.server.state_cache = None
 
         # Start server in background thread
         self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)